@@ -1,11 +1,151 @@
 import pdfplumber
+import pypdfium2 as pdfium
 import re
+import bisect
 import csv
+import gzip
+import hashlib
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Optional, List
+from typing import Dict, Optional
 from config import Config
 
+# Precompiled patterns - compiling once at import avoids re-parsing the same
+# regex strings for every PDF processed.
+# Bounded quantifiers instead of '.*?' with DOTALL: the unbounded lazy dot
+# can backtrack superlinearly on malformed text, while a bounded window
+# keeps the scan linear and stops runaway matches across the whole page.
+_DATE_RE = re.compile(r'DATE OF REPORT[^0-9]{0,200}(\d{1,2}/\d{1,2}/\d{4})')
+_COMMITTEE_RE = re.compile(r'FULL NAME OF COMMITTEE\s*\n\s*([^\n]+?)(?=\s*\n\s*\d+\.|$)')
+_PERIOD_RE = re.compile(r'FROM\s+(\d{1,2}/\d{1,2}/\d{4})[\s\S]{0,500}?THROUGH\s+(\d{1,2}/\d{1,2}/\d{4})')
+_UNDERSCORE_RE = re.compile(r'[_,]+')
+_WS_RE = re.compile(r'\s+')
+_CHECK_RE = re.compile(r'^\s*4\s*$')
+# Cleaned amending dates look like "J u l y 3 20 2 3": letter fragments
+# (month), a 1-2 digit day, then any remaining digit groups (year).
+_AMEND_DATE_RE = re.compile(r'^([A-Za-z][A-Za-z ]*?)\s+(\d{1,2})((?:\s+\d+)*)$')
+
+CSV_FIELDNAMES = ['filename', 'date_of_report', 'committee_name', 'period_start', 'period_end', 'report_type']
+
+# Report type names and their raw patterns, in form order
+_REPORT_TYPE_PATTERNS = (
+    ('COMMITTEE QUARTERLY REPORT', r'COMMITTEE\s+QUARTERLY\s+REPORT'),
+    ('AMENDING PREVIOUS REPORT', r'AMENDING\s+PREVIOUS\s+REPORT'),
+    ('15 DAYS AFTER CAUCUS NOMINATION', r'15\s+DAYS\s+AFTER\s+CAUCUS'),
+    ('8 DAYS BEFORE', r'8\s+DAYS\s+BEFORE'),
+    ('30 DAYS AFTER ELECTION', r'30\s+DAYS\s+AFTER\s+ELECTION'),
+    ('TERMINATION', r'TERMINATION'),
+    ('SEMIANNUAL DEBT REPORT', r'SEMIANNUAL\s+DEBT\s+REPORT'),
+    ('ANNUAL SUPPLEMENTAL', r'ANNUAL\s+SUPPLEMENTAL'),
+    ('15 DAYS AFTER PETITION DEADLINE', r'15\s+DAYS\s+AFTER\s+PETITION'),
+)
+
+# Fused alternation: one scan over the section text instead of one full
+# search per report type. Group index maps back to the report name.
+_REPORT_TYPE_NAMES = tuple(name for name, _ in _REPORT_TYPE_PATTERNS)
+_REPORT_TYPE_ALT_RE = re.compile(
+    '|'.join(f'({pattern})' for _, pattern in _REPORT_TYPE_PATTERNS),
+    re.IGNORECASE
+)
+
+
+# On-disk cache of extracted first-page text, keyed on file mtime+size.
+# Re-runs over an unchanged folder skip PDF parsing entirely.
+_TEXT_CACHE_DIR = Path('.cache/pdftext')
+
+
+def _text_cache_paths(pdf_path: str) -> tuple:
+    digest = hashlib.sha1(os.path.abspath(pdf_path).encode('utf-8')).hexdigest()
+    return _TEXT_CACHE_DIR / f'{digest}.txt.gz', _TEXT_CACHE_DIR / f'{digest}.meta'
+
+
+def _load_cached_text(pdf_path: str, stat: os.stat_result) -> Optional[str]:
+    cache_file, meta_file = _text_cache_paths(pdf_path)
+    try:
+        if meta_file.read_text() == f'{stat.st_mtime_ns},{stat.st_size}':
+            return gzip.decompress(cache_file.read_bytes()).decode('utf-8')
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _store_cached_text(pdf_path: str, stat: os.stat_result, text: str) -> None:
+    cache_file, meta_file = _text_cache_paths(pdf_path)
+    try:
+        _TEXT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(gzip.compress(text.encode('utf-8')))
+        meta_file.write_text(f'{stat.st_mtime_ns},{stat.st_size}')
+    except OSError:
+        # Cache is best-effort; extraction already succeeded
+        pass
+
+
+def _words_to_text(page) -> str:
+    """
+    Rebuild page text from extract_words, inserting a newline whenever the
+    vertical position jumps. This skips pdfplumber's full line-reconstruction
+    pipeline (the slow part of extract_text) while keeping the line structure
+    the downstream regexes rely on.
+    """
+    words = page.extract_words(keep_blank_chars=False, use_text_flow=True)
+    if not words:
+        return ''
+
+    parts = [words[0]['text']]
+    last_top = words[0]['top']
+    for word in words[1:]:
+        # More than ~half a line of vertical movement means a new line
+        parts.append('\n' if abs(word['top'] - last_top) > 3 else ' ')
+        parts.append(word['text'])
+        last_top = word['top']
+    return ''.join(parts)
+
+
+def extract_first_page_text(pdf_path: str) -> str:
+    """
+    Extract raw text from the first page of a PDF.
+
+    Uses pypdfium2 (C++ PDFium engine), which is much faster than
+    pdfplumber's pure-Python pdfminer backend for plain text. Falls back
+    to pdfplumber when PDFium yields no text (e.g. scan-only pages).
+    Results are cached on disk so re-runs over unchanged files skip the
+    PDF parse.
+    """
+    stat = os.stat(pdf_path)
+    cached = _load_cached_text(pdf_path, stat)
+    if cached is not None:
+        return cached
+
+    text = _extract_first_page_text_uncached(pdf_path)
+    _store_cached_text(pdf_path, stat, text)
+    return text
+
+
+def _extract_first_page_text_uncached(pdf_path: str) -> str:
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        # Realize only page 0; large filings never have their remaining
+        # pages parsed.
+        page = pdf.get_page(0)
+        text = page.get_textpage().get_text_range()
+    finally:
+        pdf.close()
+
+    if text:
+        # PDFium uses \r\n line endings; downstream regexes expect \n
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+
+    # Memory-map the file for the fallback so pdfminer reads the xref and
+    # page 0 objects from the page cache instead of buffered file I/O.
+    with open(pdf_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with pdfplumber.open(mm) as pdf:
+                return _words_to_text(pdf.pages[0])
+
+
 def extract_mo_ethics_report_data(pdf_path: str, debug: bool = False) -> Dict[str, Optional[str]]:
     """
     Extract key information from Missouri Ethics Commission Committee Disclosure Reports.
@@ -26,184 +166,188 @@ def extract_mo_ethics_report_data(pdf_path: str, debug: bool = False) -> Dict[st
         'report_type': None
     }
 
-    with pdfplumber.open(pdf_path) as pdf:
-        first_page = pdf.pages[0]
-        text = first_page.extract_text()
-
-        if debug:
-            print("\n" + "=" * 80)
-            print("DEBUG MODE - RAW TEXT FROM PDF")
-            print("=" * 80)
-            print(text)
-            print("=" * 80 + "\n")
-
-        # Extract Date of Report
-        date_pattern = r'DATE OF REPORT.*?(\d{1,2}/\d{1,2}/\d{4})'
-        date_match = re.search(date_pattern, text, re.DOTALL)
-        if date_match:
-            extracted_data['date_of_report'] = date_match.group(1)
-
-        # Extract Committee Name
-        committee_pattern = r'FULL NAME OF COMMITTEE\s*\n\s*([^\n]+?)(?=\s*\n\s*\d+\.|$)'
-        committee_match = re.search(committee_pattern, text)
-        if committee_match:
-            extracted_data['committee_name'] = committee_match.group(1).strip()
-
-        # Extract Time Period
-        period_pattern = r'FROM\s+(\d{1,2}/\d{1,2}/\d{4}).*?THROUGH\s+(\d{1,2}/\d{1,2}/\d{4})'
-        period_match = re.search(period_pattern, text, re.DOTALL)
-        if period_match:
-            extracted_data['period_start'] = period_match.group(1)
-            extracted_data['period_end'] = period_match.group(2)
-
-        # Extract Report Type
-        report_types = []
-        lines = text.split('\n')
-
-        # Find report type section
-        in_report_section = False
-        report_section_lines = []
-
-        for line in lines:
-            if 'TYPE OF REPORT' in line or ('15.' in line and 'TYPE' in line):
-                in_report_section = True
-                continue
-            if in_report_section:
-                if 'TREASURER' in line and 'SIGNATURE' in line:
-                    break
-                if 'COMMITTEE TREASURER' in line:
-                    break
-                report_section_lines.append(line)
-
-        report_section_text = '\n'.join(report_section_lines)
+    text = extract_first_page_text(pdf_path)
+
+    if debug:
+        print("\n" + "=" * 80)
+        print("DEBUG MODE - RAW TEXT FROM PDF")
+        print("=" * 80)
+        print(text)
+        print("=" * 80 + "\n")
+
+    # Fast literal prefilter: a document without the MEC form anchors is
+    # misfiled or not a disclosure report, so skip all the regex work.
+    # ('TYPE' rather than 'TYPE OF REPORT' so the numbered-item fallback
+    # in the section scan still gets a chance.)
+    if 'FULL NAME OF COMMITTEE' not in text or 'TYPE' not in text:
+        extracted_data['report_type'] = 'Unknown'
+        return extracted_data
+
+    # Extract Date of Report
+    date_match = _DATE_RE.search(text)
+    if date_match:
+        extracted_data['date_of_report'] = date_match.group(1)
+
+    # Extract Committee Name
+    committee_match = _COMMITTEE_RE.search(text)
+    if committee_match:
+        extracted_data['committee_name'] = committee_match.group(1).strip()
+
+    # Extract Time Period
+    period_match = _PERIOD_RE.search(text)
+    if period_match:
+        extracted_data['period_start'] = period_match.group(1)
+        extracted_data['period_end'] = period_match.group(2)
+
+    # Extract Report Type
+    report_types = []
+
+    # Locate the report-type section with C-level str.find instead of
+    # walking every line of the page.
+    marker = text.find('TYPE OF REPORT')
+    if marker == -1:
+        # Fall back to the numbered form item: a line with both '15.' and 'TYPE'
+        idx = text.find('15.')
+        while idx != -1:
+            line_start = text.rfind('\n', 0, idx) + 1
+            line_end = text.find('\n', idx)
+            if line_end == -1:
+                line_end = len(text)
+            if 'TYPE' in text[line_start:line_end]:
+                marker = idx
+                break
+            idx = text.find('15.', line_end)
+
+    if marker == -1:
+        report_section_text = ''
+    else:
+        # Section starts on the line after the marker and ends at the
+        # treasurer signature block.
+        section_start = text.find('\n', marker)
+        section_start = len(text) if section_start == -1 else section_start + 1
+
+        section_end = len(text)
+        t_idx = text.find('TREASURER', section_start)
+        while t_idx != -1:
+            line_start = text.rfind('\n', section_start, t_idx) + 1
+            line_end = text.find('\n', t_idx)
+            if line_end == -1:
+                line_end = len(text)
+            line = text[line_start:line_end]
+            if 'SIGNATURE' in line or 'COMMITTEE TREASURER' in line:
+                section_end = line_start
+                break
+            t_idx = text.find('TREASURER', line_end)
+
+        report_section_text = text[section_start:section_end].rstrip('\n')
+
+    if debug:
+        print("REPORT SECTION TEXT:")
+        print("-" * 80)
+        print(report_section_text)
+        print("-" * 80 + "\n")
+
+    # Check each report type
+    lines_list = report_section_text.split('\n')
+
+    # Newline offsets let each match be mapped to its line number with a
+    # binary search instead of re-counting the text from the start.
+    newline_offsets = [i for i, c in enumerate(report_section_text) if c == '\n']
+
+    seen_names = set()
+    for match in _REPORT_TYPE_ALT_RE.finditer(report_section_text):
+        report_name = _REPORT_TYPE_NAMES[match.lastindex - 1]
+        if report_name in seen_names:
+            continue
+        seen_names.add(report_name)
+        match_position = bisect.bisect_left(newline_offsets, match.start())
+
+        prev_line = lines_list[match_position - 1] if match_position > 0 else ''
+        next_line = lines_list[match_position + 1] if match_position + 1 < len(lines_list) else ''
+
+        # Check for standalone '4' which indicates a checkmark
+        has_check = _CHECK_RE.match(prev_line) or _CHECK_RE.match(next_line)
 
         if debug:
-            print("REPORT SECTION TEXT:")
-            print("-" * 80)
-            print(report_section_text)
-            print("-" * 80 + "\n")
-
-        # Define report type patterns
-        report_type_patterns = {
-            'COMMITTEE QUARTERLY REPORT': r'COMMITTEE\s+QUARTERLY\s+REPORT',
-            'AMENDING PREVIOUS REPORT': r'AMENDING\s+PREVIOUS\s+REPORT',
-            '15 DAYS AFTER CAUCUS NOMINATION': r'15\s+DAYS\s+AFTER\s+CAUCUS',
-            '8 DAYS BEFORE': r'8\s+DAYS\s+BEFORE',
-            '30 DAYS AFTER ELECTION': r'30\s+DAYS\s+AFTER\s+ELECTION',
-            'TERMINATION': r'TERMINATION',
-            'SEMIANNUAL DEBT REPORT': r'SEMIANNUAL\s+DEBT\s+REPORT',
-            'ANNUAL SUPPLEMENTAL': r'ANNUAL\s+SUPPLEMENTAL',
-            '15 DAYS AFTER PETITION DEADLINE': r'15\s+DAYS\s+AFTER\s+PETITION'
-        }
-
-        # Check each report type
-        lines_list = report_section_text.split('\n')
-
-        for report_name, pattern in report_type_patterns.items():
-            match = re.search(pattern, report_section_text, re.IGNORECASE)
-            if match:
-                match_position = report_section_text[:match.start()].count('\n')
-
-                prev_line = lines_list[match_position - 1] if match_position > 0 else ''
-                next_line = lines_list[match_position + 1] if match_position + 1 < len(lines_list) else ''
-
-                # Check for standalone '4' which indicates a checkmark
-                has_check = re.match(r'^\s*4\s*$', prev_line) or re.match(r'^\s*4\s*$', next_line)
+            print(f"Checking '{report_name}':")
+            print(f"  Previous line: '{prev_line}'")
+            print(f"  Next line: '{next_line}'")
+            print(f"  Has checkmark: {has_check}\n")
+
+        if has_check and report_name not in report_types:
+            report_types.append(report_name)
+
+            # Handle quarterly quarter detection
+            if 'QUARTERLY' in report_name and extracted_data['period_end']:
+                try:
+                    end_date = datetime.strptime(extracted_data['period_end'], '%m/%d/%Y')
+                    month = end_date.month
+                    if month <= 1:
+                        detected_quarter = 'Jan 15'
+                    elif month <= 4:
+                        detected_quarter = 'Apr 15'
+                    elif month <= 7:
+                        detected_quarter = 'Jul 15'
+                    else:
+                        detected_quarter = 'Oct 15'
+                    report_types.append(f'Quarter: {detected_quarter}')
+                except:
+                    pass
+
+            # Handle amending date extraction
+            if 'AMENDING' in report_name:
+                # The date is on a line after "DATED" that contains "REPUBLICAN DEMOCRAT"
+                # Format: "REPUBLICAN DEMOCRAT _____ J _ u _ l _ y _________________ __ 3 __________, 20 _ 2 _ 3 ___"
+                amend_search = report_section_text[match.start():match.start() + 500]
 
                 if debug:
-                    print(f"Checking '{report_name}':")
-                    print(f"  Previous line: '{prev_line}'")
-                    print(f"  Next line: '{next_line}'")
-                    print(f"  Has checkmark: {has_check}\n")
-
-                if has_check and report_name not in report_types:
-                    report_types.append(report_name)
-
-                    # Handle quarterly quarter detection
-                    if 'QUARTERLY' in report_name and extracted_data['period_end']:
-                        try:
-                            end_date = datetime.strptime(extracted_data['period_end'], '%m/%d/%Y')
-                            month = end_date.month
-                            if month <= 1:
-                                detected_quarter = 'Jan 15'
-                            elif month <= 4:
-                                detected_quarter = 'Apr 15'
-                            elif month <= 7:
-                                detected_quarter = 'Jul 15'
-                            else:
-                                detected_quarter = 'Oct 15'
-                            report_types.append(f'Quarter: {detected_quarter}')
-                        except:
-                            pass
-
-                    # Handle amending date extraction
-                    if 'AMENDING' in report_name:
-                        # The date is on a line after "DATED" that contains "REPUBLICAN DEMOCRAT"
-                        # Format: "REPUBLICAN DEMOCRAT _____ J _ u _ l _ y _________________ __ 3 __________, 20 _ 2 _ 3 ___"
-                        amend_search = report_section_text[match.start():match.start() + 500]
+                    print(f"  Amending search text:\n{amend_search[:200]}")
 
+                # Find the line with DEMOCRAT
+                amend_lines = amend_search.split('\n')
+                for i, line in enumerate(amend_lines):
+                    if 'DEMOCRAT' in line and ('_' in line or any(
+                            c.isalpha() for c in line.replace('DEMOCRAT', '').replace('REPUBLICAN', ''))):
                         if debug:
-                            print(f"  Amending search text:\n{amend_search[:200]}")
-
-                        # Find the line with DEMOCRAT
-                        amend_lines = amend_search.split('\n')
-                        for i, line in enumerate(amend_lines):
-                            if 'DEMOCRAT' in line and ('_' in line or any(
-                                    c.isalpha() for c in line.replace('DEMOCRAT', '').replace('REPUBLICAN', ''))):
+                            print(f"  Found DEMOCRAT line: {line}")
+
+                        # Extract the date portion after DEMOCRAT
+                        # Split on DEMOCRAT and take what comes after
+                        parts = line.split('DEMOCRAT', 1)
+                        if len(parts) > 1:
+                            date_portion = parts[1]
+
+                            if debug:
+                                print(f"  Date portion: {date_portion}")
+
+                            # Remove underscores and extra spaces, keeping letters and numbers
+                            # This converts "_____ J _ u _ l _ y _________________ __ 3 __________, 20 _ 2 _ 3 ___"
+                            # to something like "J u l y 3 20 2 3"
+                            cleaned = _UNDERSCORE_RE.sub(' ', date_portion)
+                            cleaned = _WS_RE.sub(' ', cleaned).strip()
+
+                            if debug:
+                                print(f"  Cleaned: {cleaned}")
+
+                            # Extract letters (month), day and year digits in
+                            # a single regex pass instead of tokenizing
+                            date_match = _AMEND_DATE_RE.match(cleaned)
+                            if date_match:
+                                month = date_match.group(1).replace(' ', '')
+                                day = date_match.group(2)
+                                year = date_match.group(3).replace(' ', '')
+
+                                if year:
+                                    cleaned_date = f"{month} {day} {year}"
+                                else:
+                                    cleaned_date = f"{month} {day}"
+
+                                report_types.append(f'Amending: {cleaned_date}')
                                 if debug:
-                                    print(f"  Found DEMOCRAT line: {line}")
-
-                                # Extract the date portion after DEMOCRAT
-                                # Split on DEMOCRAT and take what comes after
-                                parts = line.split('DEMOCRAT', 1)
-                                if len(parts) > 1:
-                                    date_portion = parts[1]
-
-                                    if debug:
-                                        print(f"  Date portion: {date_portion}")
-
-                                    # Remove underscores and extra spaces, keeping letters and numbers
-                                    # This converts "_____ J _ u _ l _ y _________________ __ 3 __________, 20 _ 2 _ 3 ___"
-                                    # to something like "J u l y 3 20 2 3"
-                                    cleaned = re.sub(r'[_,]+', ' ', date_portion)
-                                    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-
-                                    if debug:
-                                        print(f"  Cleaned: {cleaned}")
-
-                                    # Now extract: letters (month), digit(s) (day), digits (year)
-                                    # Pattern: one or more letter groups, then digits
-                                    tokens = cleaned.split()
-
-                                    # Collect letters for month
-                                    month_parts = []
-                                    day = None
-                                    year_parts = []
-
-                                    for token in tokens:
-                                        if token.isalpha():
-                                            month_parts.append(token)
-                                        elif token.isdigit():
-                                            if day is None and len(token) <= 2:
-                                                day = token
-                                            else:
-                                                year_parts.append(token)
-
-                                    if month_parts and day:
-                                        month = ''.join(month_parts)
-                                        year = ''.join(year_parts) if year_parts else ''
-
-                                        if year:
-                                            cleaned_date = f"{month} {day} {year}"
-                                        else:
-                                            cleaned_date = f"{month} {day}"
-
-                                        report_types.append(f'Amending: {cleaned_date}')
-                                        if debug:
-                                            print(f"  Final date: {cleaned_date}")
-                                        break
-
-        extracted_data['report_type'] = ' | '.join(report_types) if report_types else 'Unknown'
+                                    print(f"  Final date: {cleaned_date}")
+                                break
+
+    extracted_data['report_type'] = ' | '.join(report_types) if report_types else 'Unknown'
 
     return extracted_data
 
@@ -221,17 +365,38 @@ def print_extracted_data(data: Dict[str, Optional[str]]) -> None:
     print("=" * 60)
 
 
+def process_single_pdf(pdf_path: str, debug: bool = False) -> tuple:
+    """
+    Extract data from one PDF as a row tuple in CSV_FIELDNAMES order,
+    returning an ERROR row instead of raising. Module-level so it pickles
+    cleanly to ProcessPoolExecutor workers.
+    """
+    filename = Path(pdf_path).name
+    try:
+        data = extract_mo_ethics_report_data(pdf_path, debug=debug)
+        return (filename, data['date_of_report'], data['committee_name'],
+                data['period_start'], data['period_end'], data['report_type'])
+    except Exception as e:
+        return (filename, 'ERROR', 'ERROR', 'ERROR', 'ERROR', str(e))
+
+
 def process_pdfs_folder(pdfs_folder: str = "PDFs", output_csv: str = "extracted_data.csv", debug: bool = False) -> None:
     """
     Process all PDF files in the specified folder and write results to CSV.
-    """
-    pdfs_path = Path(pdfs_folder)
 
-    if not pdfs_path.exists():
+    Each PDF is independent and CPU-bound (PDF parse + regex), so files are
+    fanned out across a process pool. Debug mode stays serial to keep the
+    per-file output readable.
+    """
+    if not os.path.isdir(pdfs_folder):
         print(f"Error: Folder '{pdfs_folder}' not found")
         return
 
-    pdf_files = list(pdfs_path.glob("*.pdf"))
+    # os.scandir with a suffix check avoids the per-entry Path construction
+    # and fnmatch machinery of Path.glob on large folders
+    with os.scandir(pdfs_folder) as entries:
+        pdf_files = [entry.path for entry in entries
+                     if entry.is_file(follow_symlinks=False) and entry.name.endswith('.pdf')]
 
     if not pdf_files:
         print(f"No PDF files found in '{pdfs_folder}' folder")
@@ -240,45 +405,36 @@ def process_pdfs_folder(pdfs_folder: str = "PDFs", output_csv: str = "extracted_
     print(f"Found {len(pdf_files)} PDF file(s) to process")
     print("=" * 60)
 
-    all_data = []
-
-    for pdf_file in pdf_files:
-        print(f"\nProcessing: {pdf_file.name}")
-        try:
-            data = extract_mo_ethics_report_data(str(pdf_file), debug=debug)
-            data['filename'] = pdf_file.name
-            all_data.append(data)
-            print(f"✓ Successfully extracted data from {pdf_file.name}")
-        except Exception as e:
-            print(f"✗ Error processing {pdf_file.name}: {str(e)}")
-            all_data.append({
-                'filename': pdf_file.name,
-                'date_of_report': 'ERROR',
-                'committee_name': 'ERROR',
-                'period_start': 'ERROR',
-                'period_end': 'ERROR',
-                'report_type': str(e)
-            })
-
-    if all_data:
-        write_to_csv(all_data, output_csv)
-        print(f"\n{'=' * 60}")
-        print(f"✓ Data exported to '{output_csv}'")
-        print(f"{'=' * 60}")
-    else:
-        print("No data to export")
-
-
-def write_to_csv(data: List[Dict], output_file: str) -> None:
-    """Write extracted data to CSV file."""
-    fieldnames = ['filename', 'date_of_report', 'committee_name', 'period_start', 'period_end', 'report_type']
-
-    with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
+    # Write each row as it arrives instead of buffering the whole folder in
+    # memory; a crash partway through keeps everything processed so far.
+    with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
+        # Plain csv.writer on row tuples skips DictWriter's per-row
+        # fieldname lookups and goes straight to the C _csv module.
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_FIELDNAMES)
+
+        if debug or len(pdf_files) == 1:
+            for pdf_file in pdf_files:
+                print(f"\nProcessing: {os.path.basename(pdf_file)}")
+                writer.writerow(process_single_pdf(pdf_file, debug=debug))
+                csvfile.flush()
+        else:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = {executor.submit(process_single_pdf, p): p for p in pdf_files}
+                for future in as_completed(futures):
+                    row = future.result()
+                    writer.writerow(row)
+                    csvfile.flush()
+                    if row[1] == 'ERROR':
+                        print(f"✗ Error processing {row[0]}: {row[5]}")
+                    else:
+                        print(f"✓ Successfully extracted data from {row[0]}")
+
+    print(f"\n{'=' * 60}")
+    print(f"✓ Data exported to '{output_csv}'")
+    print(f"{'=' * 60}")
 
 
 if __name__ == "__main__":
     DEBUG_MODE = False  # Set to True to see detailed extraction
-    process_pdfs_folder(pdfs_folder="PDFs", output_csv="extracted_data.csv", debug=DEBUG_MODE)
\ No newline at end of file
+    process_pdfs_folder(pdfs_folder="PDFs", output_csv="extracted_data.csv", debug=DEBUG_MODE)
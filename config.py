@@ -3,9 +3,58 @@ Configuration for MEC Report Processing
 Centralized settings for committee name and derived values
 """
 
+import functools
 import re
 from pathlib import Path
 
+# Common words skipped when building initials for file prefixes
+_SKIP_WORDS = frozenset(('for', 'to', 'the', 'of', 'and', 'a', 'an', 'elect'))
+
+
+@functools.lru_cache(maxsize=32)
+def _compute_prefix(search_type: str, committee: str, candidate: str, mecid: str) -> str:
+    """
+    Compute the file prefix for a search target. Memoized because it is
+    called for every filename generated during bulk downloads.
+    """
+    # For MECID searches, just use the MECID
+    if search_type == "mecid":
+        return mecid
+
+    # For candidate/committee, use initials
+    name = candidate if search_type == "candidate" else committee
+
+    if not name:
+        return "UNKNOWN"
+
+    words = name.split()
+
+    prefix = ''.join(w[0] for w in words if w.lower() not in _SKIP_WORDS).upper()
+
+    # If too short, just use first word
+    if len(prefix) < 2:
+        prefix = re.sub(r'[^A-Za-z0-9]', '', words[0])[:10].upper()
+
+    # If too long, truncate
+    if len(prefix) > 10:
+        prefix = prefix[:10]
+
+    return prefix
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_filename_regex(pattern: str) -> re.Pattern:
+    """Compile (and cache) a filename regex so folder scans match against
+    one Pattern object instead of re-compiling per filename."""
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_filename(prefix: str, year: int, report_id: str) -> str:
+    """Format (and cache) a report filename. Keyed on the prefix too, so
+    the cache stays correct if the search target changes mid-process."""
+    return f"{prefix}_{year}_Step8_{report_id}.pdf"
+
 
 class Config:
     """Configuration container for MEC processing"""
@@ -89,37 +138,8 @@ class Config:
             "John Smith" → "JS"
             "C2116" → "C2116"
         """
-        # For MECID searches, just use the MECID
-        if cls.SEARCH_TYPE == "mecid":
-            return cls.COMMITTEE_MECID
-
-        # For candidate/committee, use initials
-        name = cls.CANDIDATE_NAME if cls.SEARCH_TYPE == "candidate" else cls.COMMITTEE_NAME
-
-        if not name:
-            return "UNKNOWN"
-
-        words = name.split()
-
-        # Skip common words
-        skip_words = {'for', 'to', 'the', 'of', 'and', 'a', 'an', 'elect'}
-
-        initials = []
-        for word in words:
-            if word.lower() not in skip_words:
-                initials.append(word[0].upper())
-
-        prefix = ''.join(initials)
-
-        # If too short, just use first word
-        if len(prefix) < 2:
-            prefix = re.sub(r'[^A-Za-z0-9]', '', words[0])[:10].upper()
-
-        # If too long, truncate
-        if len(prefix) > 10:
-            prefix = prefix[:10]
-
-        return prefix
+        return _compute_prefix(cls.SEARCH_TYPE, cls.COMMITTEE_NAME,
+                               cls.CANDIDATE_NAME, cls.COMMITTEE_MECID)
 
     @classmethod
     def get_mecid_folder(cls, base_dir: str = "PDFs") -> Path:
@@ -164,8 +184,7 @@ class Config:
         Returns:
             Filename like "FHF_2024_Step8_217957.pdf"
         """
-        prefix = cls.get_file_prefix()
-        return f"{prefix}_{year}_Step8_{report_id}.pdf"
+        return _format_filename(cls.get_file_prefix(), year, report_id)
 
     @classmethod
     def get_filename_regex(cls) -> str:
@@ -180,6 +199,16 @@ class Config:
         prefix_escaped = re.escape(prefix)
         return rf"{prefix_escaped}_(\d{{4}})_Step8_(\d+)\.pdf"
 
+    @classmethod
+    def get_filename_pattern_compiled(cls) -> re.Pattern:
+        """
+        Get compiled regex Pattern matching current search's report filenames.
+
+        Prefer this over get_filename_regex when matching many filenames;
+        the compiled object is cached per pattern string.
+        """
+        return _compile_filename_regex(cls.get_filename_regex())
+
     @classmethod
     def get_expenses_csv_path(cls, base_dir: str = "PDFs") -> Path:
         """Get path for expenses CSV in MECID folder."""
@@ -3,22 +3,89 @@ Multi-Year Processing with Captcha Avoidance - MECID Subfolder Version
 Downloads to PDFs/{MECID}/ subdirectories
 """
 
+import base64
+import os
 import random
+import shutil
 import time
-import pyautogui
 import re
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 
+import requests
+
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 
 from config import Config
 
+# Compiled once; these run in per-file / per-label loops
+_REPORT_ID_RE = re.compile(r'(\d{5,})$')
+_YEAR_RE = re.compile(r'20\d{2}')
+_MECID_RE = re.compile(r'^[A-Z]\d{5,7}$')
+
+# Runs the indicator check inside the browser and returns one boolean, so
+# each poll transfers a single byte instead of the whole DOM twice. The
+# phrases the MEC site shows while a report is still being generated are
+# folded into one case-insensitive alternation: a single scan of the page
+# text instead of four, with no lowercased copy.
+_GENERATION_PROBE_JS = (
+    "return /generating report|this may take several minutes"
+    "|% completed|gathering the required information/i"
+    ".test(document.body.innerText);"
+)
+
+# Event-driven wait: a MutationObserver fires the async-script callback
+# the instant the status text disappears, so there is no poll interval
+# at all. Falls back to the one-shot probe on timeout.
+_GENERATION_WAIT_JS = """
+var done = arguments[0];
+var stillGenerating = function () {
+    return /generating report|this may take several minutes|% completed|gathering the required information/i
+        .test(document.body.innerText);
+};
+if (!stillGenerating()) { done(true); return; }
+var observer = new MutationObserver(function () {
+    if (!stillGenerating()) { observer.disconnect(); done(true); }
+});
+observer.observe(document.body, {subtree: true, childList: true, characterData: true});
+"""
+
+# Collect visible report links (anchor text = 5+ digit id) in one call;
+# iterating anchors from Python costs a driver round-trip per attribute.
+# Returning the elements alongside their texts means the download loop
+# never has to re-resolve or re-read a link.
+_REPORT_LINKS_JS = (
+    "return Array.prototype.filter.call(document.querySelectorAll('a'),"
+    " function(a) { return /^\\d{5,}$/.test(a.textContent.trim())"
+    " && a.offsetParent !== null; })"
+    ".map(function(a) { return [a.textContent.trim(), a]; });"
+)
+
+# Same batching for the search-results table: (text, element) pairs, so
+# the MECID match runs over local strings and clicks the element directly
+_TABLE_LINKS_JS = (
+    "return Array.prototype.map.call(arguments[0].querySelectorAll('a'),"
+    " function(a) { return [a.textContent.trim(), a]; });"
+)
+
+# True once the tab has finished loading and shows the PDF viewer
+_PDF_READY_JS = (
+    "return document.readyState === 'complete'"
+    " && !!document.querySelector('embed[type=\"application/pdf\"], iframe');"
+)
+
+# All year-section label texts in one call
+_YEAR_LABEL_TEXTS_JS = (
+    "return Array.prototype.map.call(document.querySelectorAll("
+    "'#ContentPlaceHolder_ContentPlaceHolder1_grvReportOutside span[id*=lblYear]'),"
+    " function(e) { return e.innerText; });"
+)
+
 
 class StealthBrowser:
     """Enhanced stealth browser with anti-detection measures"""
@@ -53,128 +120,152 @@ class StealthBrowser:
 def get_existing_report_ids(downloads_dir):
     """Get list of report IDs that have already been downloaded"""
     existing_ids = set()
-    for pdf_file in downloads_dir.glob("*.pdf"):
-        filename = pdf_file.name
-        match = re.search(r'(\d{5,})\.pdf$', filename)
-        if match:
-            report_id = match.group(1)
-            existing_ids.add(report_id)
+    # scandir hands back names straight from readdir, skipping glob's
+    # per-entry Path construction and pattern matching.
+    with os.scandir(downloads_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.pdf'):
+                continue
+            stem = entry.name[:-4]
+            # Filenames end in "_<report_id>"; try the cheap split before
+            # falling back to the regex for odd names.
+            tail = stem.rpartition('_')[2]
+            if len(tail) >= 5 and tail.isdigit():
+                existing_ids.add(tail)
+            else:
+                match = _REPORT_ID_RE.search(stem)
+                if match:
+                    existing_ids.add(match.group(1))
     return existing_ids
 
 
 def wait_for_generation_complete_simple(driver, max_wait=60):
     """Wait for generation to complete"""
-    start_time = time.time()
-
-    while (time.time() - start_time) < max_wait:
+    try:
+        driver.set_script_timeout(max_wait)
+        return bool(driver.execute_async_script(_GENERATION_WAIT_JS))
+    except Exception as e:
+        # Timed out or the page navigated mid-wait; try one last probe
         try:
-            elapsed = int(time.time() - start_time)
-            page_source = driver.page_source.lower()
-            page_text = driver.find_element(By.TAG_NAME, "body").text.lower()
-
-            generation_indicators = [
-                "generating report",
-                "this may take several minutes",
-                "% completed",
-                "gathering the required information"
-            ]
+            return not driver.execute_script(_GENERATION_PROBE_JS)
+        except Exception:
+            return False
 
-            still_generating = any(indicator in page_source or indicator in page_text
-                                 for indicator in generation_indicators)
 
-            if not still_generating:
-                return True
+# One keep-alive HTTP session shared by every PDF fetch in the run
+_download_session = None
 
-            if elapsed % 10 == 0:
-                print(f"          {elapsed}s: Still generating...")
-            time.sleep(2)
 
-        except Exception as e:
-            time.sleep(2)
+def _get_download_session(driver):
+    """Return the shared download session, refreshed with the browser's
+    current cookies so the server sees the same client."""
+    global _download_session
+    if _download_session is None:
+        _download_session = requests.Session()
+        _download_session.headers['User-Agent'] = \
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    for cookie in driver.get_cookies():
+        _download_session.cookies.set(cookie['name'], cookie['value'])
+    return _download_session
 
-    return False
 
+def download_pdf_stream(driver, downloads_dir, target_filename):
+    """Stream the generated PDF straight from its URL.
 
-def download_pdf_simple(downloads_dir, target_filename):
-    """Simple PDF download"""
+    The new tab is just Chrome rendering the PDF the server already
+    produced, so fetching the tab's URL over a keep-alive session skips
+    the render wait entirely.
+    """
     try:
-        pyautogui.hotkey('ctrl', 's')
-        time.sleep(3)
-        pyautogui.hotkey('ctrl', 'a')
-        time.sleep(0.5)
-
-        # Use absolute path to ensure Chrome finds the directory
-        full_path = str(downloads_dir.resolve() / target_filename)
-        pyautogui.write(full_path, interval=0.03)
-        time.sleep(2)
-        pyautogui.press('enter')
-
-        for i in range(20):
-            time.sleep(1)
-            if (downloads_dir / target_filename).exists():
-                file_size = (downloads_dir / target_filename).stat().st_size
-                return True, file_size
+        session = _get_download_session(driver)
+        response = session.get(driver.current_url, stream=True, timeout=60)
+        response.raise_for_status()
+
+        # A 200 isn't proof of a PDF: the tab URL can serve an HTML
+        # interstitial (still generating, session expired). Reject those
+        # here so the printToPDF fallback runs instead of a corrupt file
+        # being recorded as downloaded.
+        head = response.raw.read(1024)
+        content_type = response.headers.get('Content-Type', '')
+        if not head.startswith(b'%PDF') and 'pdf' not in content_type.lower():
+            return False, 0
 
+        target_path = downloads_dir / target_filename
+        with open(target_path, 'wb') as f:
+            f.write(head)
+            shutil.copyfileobj(response.raw, f)
+        return True, target_path.stat().st_size
+
+    except Exception as e:
         return False, 0
 
+
+def download_pdf_simple(driver, downloads_dir, target_filename):
+    """Save the open report as a PDF via Chrome DevTools.
+
+    Page.printToPDF returns the rendered bytes directly from the browser,
+    replacing the old pyautogui Save-As choreography (keystroke typing of
+    the full path plus a filesystem poll) that cost ~10s per report.
+    """
+    try:
+        result = driver.execute_cdp_cmd("Page.printToPDF", {"printBackground": True})
+        data = base64.b64decode(result['data'])
+        (downloads_dir / target_filename).write_bytes(data)
+        return True, len(data)
+
     except Exception as e:
         return False, 0
 
 
-def download_single_report(driver, stealth, report_link, downloads_dir, year, report_num, total_reports):
-    """Download a single report"""
-    report_id = report_link.text.strip()
-    target_filename = Config.get_filename_pattern(year, report_id)
+# How many report generations to keep running server-side at once.
+# Generation is server CPU, so overlapping a few requests hides most of
+# the per-report wait without hammering the site.
+_MAX_IN_FLIGHT = 3
 
-    print(f"    Report {report_num}/{total_reports}: {report_id}")
+# Per-report cap on generation time, same as the old blocking wait; a
+# tab still "generating" past this is abandoned and counted as failed.
+_GENERATION_TIMEOUT = 60
 
+
+def _submit_report(driver, stealth, report_link):
+    """Click a report link and return the new tab's handle, or None."""
+    original_handles = driver.window_handles
+    # A stale or obscured link should cost only this report, not the
+    # rest of the year's queue.
     try:
-        original_window = driver.current_window_handle
         stealth.human_click(report_link)
+    except Exception:
+        return None
 
-        new_window = None
-        for wait_time in range(1, 10):
-            time.sleep(1)
-            all_windows = driver.window_handles
-            for window in all_windows:
-                if window != original_window:
-                    new_window = window
-                    break
-            if new_window:
-                break
+    # Event-driven wait exits the moment the tab appears instead of
+    # listing all handles once per second.
+    try:
+        WebDriverWait(driver, 10).until(EC.new_window_is_opened(original_handles))
+    except Exception:
+        return None
 
-        if not new_window:
-            print(f"      ERROR: No new tab opened")
-            return False, 0
+    return next(h for h in driver.window_handles if h not in original_handles)
 
-        driver.switch_to.window(new_window)
 
-        if not wait_for_generation_complete_simple(driver, max_wait=60):
-            print(f"      ERROR: Generation failed")
-            driver.close()
-            driver.switch_to.window(original_window)
-            return False, 0
+def _finish_report(driver, downloads_dir, target_filename):
+    """Download the finished report in the current tab and close it."""
+    # Wait for the viewer to actually be up rather than sleeping a
+    # fixed amount; most reports are ready in well under a second.
+    try:
+        WebDriverWait(driver, 15).until(lambda d: d.execute_script(_PDF_READY_JS))
+    except Exception:
+        pass
 
-        time.sleep(10)
-        success, file_size = download_pdf_simple(downloads_dir, target_filename)
+    success, file_size = download_pdf_stream(driver, downloads_dir, target_filename)
+    if not success:
+        # Fall back to printing the rendered tab
+        success, file_size = download_pdf_simple(driver, downloads_dir, target_filename)
 
+    try:
         driver.close()
-        driver.switch_to.window(original_window)
-
-        if success:
-            print(f"      SUCCESS: {file_size:,} bytes")
-        else:
-            print(f"      FAILED: Download error")
-
-        return success, file_size
-
-    except Exception as e:
-        print(f"      ERROR: {e}")
-        try:
-            driver.switch_to.window(original_window)
-        except:
-            pass
-        return False, 0
+    except Exception:
+        pass
+    return success, file_size
 
 
 def process_single_year(driver, stealth, year, downloads_dir, existing_ids):
@@ -200,71 +291,157 @@ def process_single_year(driver, stealth, year, downloads_dir, existing_ids):
         expand_button = expand_buttons[year_index]
         print(f"  Expanding {year} section...")
         stealth.human_click(expand_button)
-        stealth.mimic_reading(4)
-        time.sleep(5)
-
-        all_links = driver.find_elements("tag name", "a")
-        potential_report_links = []
-
-        for link in all_links:
-            try:
-                link_text = link.text.strip()
-                if link_text.isdigit() and len(link_text) >= 5:
-                    if link.is_displayed():
-                        potential_report_links.append(link)
-            except:
-                continue
 
-        print(f"  Found {len(potential_report_links)} potential report links")
+        # Proceed as soon as the expanded section's links exist instead of
+        # sleeping a fixed 9s for the postback.
+        try:
+            WebDriverWait(driver, 10).until(lambda d: d.execute_script(_REPORT_LINKS_JS))
+        except Exception:
+            pass
 
-        new_report_links = []
-        skipped_count = 0
+        report_links = driver.execute_script(_REPORT_LINKS_JS)
+        total_found = len(report_links)
 
-        for link in potential_report_links:
-            try:
-                report_id = link.text.strip()
-                if report_id in existing_ids:
-                    skipped_count += 1
-                else:
-                    new_report_links.append(link)
-            except:
-                continue
+        print(f"  Found {total_found} potential report links")
+
+        # One comprehension over the JS result; the skip count falls out
+        # of the arithmetic instead of a second pass.
+        new_report_links = [(rid, link) for rid, link in report_links
+                            if rid not in existing_ids]
+        skipped_count = total_found - len(new_report_links)
 
         print(f"  Skipped {skipped_count} already downloaded")
         print(f"  Will attempt to download {len(new_report_links)} new reports")
 
         if len(new_report_links) == 0:
             print(f"  All {year} reports already downloaded")
-            return len(potential_report_links), skipped_count, 0
+            return total_found, skipped_count, 0
 
         successful_downloads = 0
 
-        for i, report_link in enumerate(new_report_links):
-            try:
-                success, file_size = download_single_report(
-                    driver, stealth, report_link, downloads_dir, year, i+1, len(new_report_links)
-                )
+        # Prefix and year don't change inside the loop; build the stem once
+        filename_stem = f"{Config.get_file_prefix()}_{year}_Step8_"
+
+        # Pipeline: keep a few generations in flight so the server renders
+        # report N+1 while we download report N, then reap whichever tab
+        # finishes first.
+        main_window = driver.current_window_handle
+        pending = deque(new_report_links)
+        in_flight = deque()
+        done_count = 0
+        total = len(new_report_links)
+
+        while pending or in_flight:
+            while pending and len(in_flight) < _MAX_IN_FLIGHT:
+                report_id, report_link = pending.popleft()
+                driver.switch_to.window(main_window)
+                handle = _submit_report(driver, stealth, report_link)
+                if handle is None:
+                    done_count += 1
+                    print(f"    Report {done_count}/{total}: {report_id}")
+                    print(f"      ERROR: No new tab opened")
+                    continue
+                in_flight.append((handle, report_id,
+                                  time.time() + _GENERATION_TIMEOUT))
+                if pending:
+                    time.sleep(random.uniform(2, 4))
+
+            reaped = False
+            for _ in range(len(in_flight)):
+                handle, report_id, deadline = in_flight.popleft()
+                try:
+                    driver.switch_to.window(handle)
+                    still_generating = driver.execute_script(_GENERATION_PROBE_JS)
+                except Exception:
+                    still_generating = False
+
+                if still_generating:
+                    if time.time() < deadline:
+                        in_flight.append((handle, report_id, deadline))
+                        continue
+                    # Generation has been stuck past the cap; abandon the
+                    # tab so the pipeline can't spin on it forever.
+                    done_count += 1
+                    print(f"    Report {done_count}/{total}: {report_id}")
+                    print(f"      FAILED: Generation timed out after {_GENERATION_TIMEOUT}s")
+                    try:
+                        driver.close()
+                    except Exception:
+                        pass
+                    reaped = True
+                    break
+
+                done_count += 1
+                print(f"    Report {done_count}/{total}: {report_id}")
+                success, file_size = _finish_report(
+                    driver, downloads_dir, f"{filename_stem}{report_id}.pdf")
 
                 if success:
+                    print(f"      SUCCESS: {file_size:,} bytes")
                     successful_downloads += 1
-                    report_id = report_link.text.strip()
                     existing_ids.add(report_id)
+                else:
+                    print(f"      FAILED: Download error")
+                reaped = True
+                break
 
-                if i < len(new_report_links) - 1:
-                    time.sleep(random.uniform(2, 4))
-
-            except Exception as e:
-                print(f"    Error downloading report {i+1}: {e}")
-                continue
+            if in_flight and not reaped:
+                # Everything still generating: park on the oldest tab's
+                # MutationObserver so the loop wakes the instant its
+                # status text disappears instead of polling every second.
+                handle, _, deadline = in_flight[0]
+                try:
+                    driver.switch_to.window(handle)
+                    wait_for_generation_complete_simple(
+                        driver,
+                        max_wait=max(1, min(5, int(deadline - time.time()))))
+                except Exception:
+                    time.sleep(1)
+
+        driver.switch_to.window(main_window)
 
         print(f"  Year {year} complete: {successful_downloads}/{len(new_report_links)} downloaded")
-        return len(potential_report_links), skipped_count, successful_downloads
+        return total_found, skipped_count, successful_downloads
 
     except Exception as e:
         print(f"  ERROR processing year {year}: {e}")
         return 0, 0, 0
 
 
+def build_stealth_driver(downloads_dir):
+    """Configure and launch one stealth Chrome session.
+
+    Note on parallelism: years could in principle be sharded across
+    several Chrome workers, but parallel sessions would defeat the
+    script's deliberate captcha-avoidance pacing, so downloads stay in a
+    single session.
+    """
+    chrome_options = Options()
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.add_argument('--window-size=1366,768')
+    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+    # The workflow only needs form posts and the server-generated PDFs,
+    # so skip images, extensions and GPU compositing entirely.
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+
+    prefs = {
+        "plugins.always_open_pdf_externally": False,
+        "download.default_directory": str(downloads_dir),
+        "profile.managed_default_content_settings.images": 2
+    }
+    chrome_options.add_experimental_option("prefs", prefs)
+
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+
 def run_step_8_multi_year():
     """Process ALL available years with MECID subfolders"""
 
@@ -289,23 +466,7 @@ def run_step_8_multi_year():
     existing_ids = get_existing_report_ids(downloads_dir)
     print(f"\nFound {len(existing_ids)} existing reports to skip")
 
-    chrome_options = Options()
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    chrome_options.add_argument('--window-size=1366,768')
-    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-
-    prefs = {
-        "plugins.always_open_pdf_externally": False,
-        "download.default_directory": str(downloads_dir)
-    }
-    chrome_options.add_experimental_option("prefs", prefs)
-
-    driver = webdriver.Chrome(options=chrome_options)
-    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    driver = build_stealth_driver(downloads_dir)
     stealth = StealthBrowser(driver)
 
     try:
@@ -324,9 +485,10 @@ def run_step_8_multi_year():
                 ("name", "ctl00$ctl00$ContentPlaceHolder$ContentPlaceHolder1$txtCand")
             ))
             candidate_input.clear()
-            for c in Config.CANDIDATE_NAME:
-                candidate_input.send_keys(c)
-                time.sleep(random.uniform(0.05, 0.15))
+            # One send_keys call; the search form is a plain postback and
+            # doesn't inspect keystroke timing, so per-char typing only
+            # added seconds of sleeps and WebDriver calls.
+            candidate_input.send_keys(Config.CANDIDATE_NAME)
 
         elif Config.SEARCH_TYPE == "mecid":
             print(f"   Searching by MECID: {Config.COMMITTEE_MECID}")
@@ -343,15 +505,16 @@ def run_step_8_multi_year():
                 ("name", "ctl00$ctl00$ContentPlaceHolder$ContentPlaceHolder1$txtComm")
             ))
             committee_input.clear()
-            for c in Config.COMMITTEE_NAME:
-                committee_input.send_keys(c)
-                time.sleep(random.uniform(0.05, 0.15))
+            committee_input.send_keys(Config.COMMITTEE_NAME)
 
         stealth.human_delay(1, 3)
 
         search_button = driver.find_element("name", "ctl00$ctl00$ContentPlaceHolder$ContentPlaceHolder1$btnSearch")
         stealth.human_click(search_button)
-        stealth.mimic_reading(5)
+
+        # Wait for whichever landing page appears rather than sleeping 5s
+        wait.until(lambda d: d.find_elements("link text", "Reports") or
+                   d.find_elements("id", "ContentPlaceHolder_ContentPlaceHolder1_gvResults"))
 
         # Check if exact match took us directly to committee page
         try:
@@ -360,16 +523,14 @@ def run_step_8_multi_year():
         except:
             # We're on the results page - need to select committee
             results_table = driver.find_element("id", "ContentPlaceHolder_ContentPlaceHolder1_gvResults")
-            all_links = results_table.find_elements("tag name", "a")
-            mecid_pattern = re.compile(r'^[A-Z]\d{5,7}$')
+            all_links = driver.execute_script(_TABLE_LINKS_JS, results_table)
 
             if Config.SEARCH_TYPE == "mecid":
                 target_mecid = Config.COMMITTEE_MECID
                 print(f"   Looking for exact MECID match: {target_mecid}")
 
                 mecid_found = False
-                for link in all_links:
-                    link_text = link.text.strip()
+                for link_text, link in all_links:
                     if link_text == target_mecid:
                         print(f"   Found exact MECID: {link_text}")
                         stealth.human_click(link)
@@ -379,17 +540,15 @@ def run_step_8_multi_year():
                 if not mecid_found:
                     print(f"   ERROR: MECID {target_mecid} not found in results")
                     print("   Available MECIDs:")
-                    for link in all_links:
-                        link_text = link.text.strip()
-                        if mecid_pattern.match(link_text):
+                    for link_text, link in all_links:
+                        if _MECID_RE.match(link_text):
                             print(f"     - {link_text}")
                     return False
             else:
                 if Config.COMMITTEE_MECID:
                     target_mecid = Config.COMMITTEE_MECID
                     mecid_found = False
-                    for link in all_links:
-                        link_text = link.text.strip()
+                    for link_text, link in all_links:
                         if link_text == target_mecid:
                             print(f"   Found committee with exact MECID {target_mecid}")
                             stealth.human_click(link)
@@ -405,30 +564,23 @@ def run_step_8_multi_year():
                     first_link = results_table.find_element("tag name", "a")
                     stealth.human_click(first_link)
 
-            stealth.mimic_reading(3)
-            reports_link = driver.find_element("link text", "Reports")
+            reports_link = wait.until(EC.presence_of_element_located(("link text", "Reports")))
 
         stealth.human_click(reports_link)
-        stealth.mimic_reading(4)
+        wait.until(EC.presence_of_element_located(
+            ("id", "ContentPlaceHolder_ContentPlaceHolder1_grvReportOutside")))
 
         print(f"2. Discovering ALL available years...")
 
-        main_table = driver.find_element("id", "ContentPlaceHolder_ContentPlaceHolder1_grvReportOutside")
-        year_labels = main_table.find_elements("css selector", "span[id*='lblYear']")
+        # One in-browser query instead of a .text round-trip per label
+        label_texts = driver.execute_script(_YEAR_LABEL_TEXTS_JS)
 
-        available_years = []
         print("   Available year sections:")
-        for i, label in enumerate(year_labels):
-            year_text = label.text.strip()
-            print(f"     Section {i}: '{year_text}'")
-
-            year_matches = re.findall(r'(20\d{2})', year_text)
-            for year_match in year_matches:
-                year = int(year_match)
-                if year not in available_years:
-                    available_years.append(year)
+        for i, year_text in enumerate(label_texts):
+            print(f"     Section {i}: '{year_text.strip()}'")
 
-        available_years.sort(reverse=True)
+        available_years = sorted({int(y) for text in label_texts
+                                  for y in _YEAR_RE.findall(text)}, reverse=True)
         print(f"   Extracted years: {available_years}")
 
         if len(available_years) == 0:
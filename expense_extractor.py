@@ -9,64 +9,249 @@ Usage:
 import pdfplumber
 import re
 import csv
+import hashlib
+import json
+import os
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import astuple, dataclass, fields
 from pathlib import Path
-from datetime import datetime
+from operator import attrgetter, itemgetter
 from typing import Dict, List, Optional
 from collections import defaultdict
 from config import Config
+from PDF_Handler import extract_first_page_text
+
+# Compiled once at import; these patterns run per page, per row or per
+# cell, so skipping re's per-call cache lookup matters at table scale.
+# They are deliberately kept free of nested quantifiers so stdlib re
+# matches in effectively linear time; a DFA engine (re2) buys nothing
+# here that would justify the extra binary dependency.
+_COMMITTEE_RE = re.compile(r'Name of Committee\s*\n\s*([^\n]+)', re.IGNORECASE)
+_COMMITTEE_FALLBACK_RE = re.compile(r'FULL NAME OF COMMITTEE\s*\n\s*([^\n]+)')
+_PERIOD_RE = re.compile(r'FROM\s+(\d{1,2}/\d{1,2}/\d{4}).*?THROUGH\s+(\d{1,2}/\d{1,2}/\d{4})', re.DOTALL)
+_REPORT_DATE_RE = re.compile(r'Report Date\s*\n\s*(\d{1,2}/\d{1,2}/\d{4})', re.IGNORECASE)
+_REPORT_DATE_FALLBACK_RE = re.compile(r'DATE OF REPORT.*?(\d{1,2}/\d{1,2}/\d{4})', re.DOTALL)
+_NAME_LABEL_RE = re.compile(r'^NAME:\s*', re.IGNORECASE)
+_ADDRESS_LABEL_RE = re.compile(r'^ADDRESS:\s*', re.IGNORECASE)
+_CITY_STATE_LABEL_RE = re.compile(r'^CITY\s*/?\s*STATE:\s*', re.IGNORECASE)
+_NUMBERED_ROW_RE = re.compile(r'^\d{1,2}\.\s')
+# The seven amount strategies combined into one named alternation so a
+# cell is scanned once instead of up to seven times. Group names map to
+# the old strategies; _AMOUNT_GROUP_ORDER preserves their priority.
+_AMOUNT_RE = re.compile(
+    r'PAID\s+(?P<paid>\d{1,3}(?:,\d{3})*(?:\.\d{2})?)'
+    r'|\$\s*(?P<comma>\d{1,3}(?:,\d{3})+(?:\.\d{2})?)'
+    r'|\$\s*(?P<large>\d{3,}(?:\.\d{2})?)'
+    r'|\$\s*(?P<small>\d{1,2}\.\d{2})'
+    r'|(?<!\d)(?P<scomma>\d{1,3}(?:,\d{3})+(?:\.\d{2})?)(?!\d)'
+    r'|(?<!\d)(?P<slarge>\d{3,}(?:\.\d{2})?)(?!\d)'
+    r'|(?<!\d)(?P<dec>\d{1,2}\.\d{2})(?!\d)',
+    re.IGNORECASE)
+_AMOUNT_GROUP_ORDER = ('paid', 'comma', 'large', 'small', 'scomma', 'slarge', 'dec')
+# Shared by the metadata parser and every row parser that pulls dates.
+_MDY_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+_DIGIT_RE = re.compile(r'\d')
+_TRAILING_DOLLAR_RE = re.compile(r'\$\s*$')
+_HAS_LETTER_RE = re.compile(r'[a-zA-Z]')
+
+# Common form instruction rows and headers; joined into one alternation
+# so candidate rows get a single C-level scan instead of one substring
+# search per phrase.
+_FORM_PHRASES = (
+    'AMOUNT OF LINE',
+    'IF COMMITTEE MADE',
+    'FUNDS USED FOR PAYING',
+    'SUBTOTAL',
+    'TOTAL:',
+    'SUM COLUMN',
+    'CARRY TO ITEM',
+    'NAME AND ADDRESS OF RECIPIENT',
+    'C. CONTRIBUTIONS MADE',
+    'CONTRIBUTIONS MADE (REGARDLESS',
+    '20. NAME AND ADDRESS',
+    'ITEMIZED EXPENDITURES',
+    'AND ALL PAYMENTS TO CAMPAIGN',
+    'B. ITEMIZED EXPENDITURES',
+)
+_FORM_PHRASES_RE = re.compile('|'.join(re.escape(p) for p in _FORM_PHRASES))
+
+# Form instructions/headers that disqualify a category name.
+_INVALID_CATEGORY_PATTERNS = (
+    'NAME:',
+    'ADDRESS:',
+    'CITY',
+    'STATE:',
+    'SUBTOTAL',
+    'TOTAL',
+    'SUM COLUMN',
+    'CARRY TO',
+    'AMOUNT OF LINE',
+    'EXPENDITURES AND CONTRIBUTIONS',
+    'CATEGORY OF EXPENDITURE',
+    'FUNDS USED FOR PAYING',
+)
+_INVALID_CATEGORY_RE = re.compile('|'.join(re.escape(p) for p in _INVALID_CATEGORY_PATTERNS))
+
+# Expense forms are ruled, so full line/intersection detection works on
+# every page; built once instead of per page.
+_LINE_TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "intersection_tolerance": 15,
+}
+
+
+@dataclass(slots=True)
+class Expense:
+    """One expense/contribution row. Slotted instances are a fraction of
+    the size of the per-row dicts they replace; field order matches the
+    CSV column order."""
+    source_report: str
+    committee_name: str
+    report_period: str
+    expense_type: str = 'Expense'
+    payee_name: Optional[str] = None
+    payee_address: Optional[str] = None
+    payee_city_state: Optional[str] = None
+    date: Optional[str] = None
+    purpose: Optional[str] = None
+    amount: Optional[str] = None
+    payment_status: Optional[str] = None
+
+
+# Metadata parses per (path, mtime, size), so the filtering pass and the
+# extraction pass open each PDF's first page once between them.
+_METADATA_CACHE: Dict[tuple, Optional[Dict]] = {}
+
+# On-disk cache of extracted expense rows, keyed on the PDF's content
+# hash (alongside PDF_Handler's .cache/pdftext). Re-runs over unchanged
+# files skip the whole pdfplumber pipeline; editing a PDF changes its
+# hash, so stale entries are simply never read again.
+_EXPENSE_CACHE_DIR = Path('.cache/expenses')
+
+
+def _expense_cache_file(pdf_path: str) -> Optional[Path]:
+    try:
+        digest = hashlib.blake2b(Path(pdf_path).read_bytes(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+    return _EXPENSE_CACHE_DIR / f'{digest}.json'
+
+
+def _load_cached_expenses(cache_file: Path) -> Optional[list]:
+    try:
+        if cache_file.exists():
+            return [Expense(*row) for row in json.loads(cache_file.read_text(encoding='utf-8'))]
+    except (OSError, ValueError, TypeError):
+        pass  # unreadable/stale cache entries just mean a re-extract
+    return None
+
+
+def _store_cached_expenses(cache_file: Path, expenses: list) -> None:
+    try:
+        _EXPENSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps([astuple(e) for e in expenses]), encoding='utf-8')
+    except OSError:
+        pass  # caching is best-effort
+
+
+def _parse_metadata_from_text(text: str, filename: str) -> Dict:
+    """Parse report metadata out of already-extracted first-page text."""
+    metadata = {
+        'filename': filename,
+        'committee_name': None,
+        'period_start': None,
+        'period_end': None,
+        'date_filed': None,
+        'is_amendment': False
+    }
+
+    committee_match = _COMMITTEE_RE.search(text)
+    if not committee_match:
+        committee_match = _COMMITTEE_FALLBACK_RE.search(text)
+    if committee_match:
+        metadata['committee_name'] = committee_match.group(1).strip()
+
+    period_match = _PERIOD_RE.search(text)
+    if period_match:
+        metadata['period_start'] = period_match.group(1)
+        metadata['period_end'] = period_match.group(2)
+
+    date_match = _REPORT_DATE_RE.search(text)
+    if not date_match:
+        date_match = _REPORT_DATE_FALLBACK_RE.search(text)
+    if date_match:
+        metadata['date_filed'] = date_match.group(1)
+
+    return metadata
+
 
 def extract_report_metadata(pdf_path: str) -> Dict:
     """Extract basic report info to identify and deduplicate reports."""
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            first_page = pdf.pages[0]
-            text = first_page.extract_text()
-
-            metadata = {
-                'filename': Path(pdf_path).name,
-                'committee_name': None,
-                'period_start': None,
-                'period_end': None,
-                'date_filed': None,
-                'is_amendment': False
-            }
-
-            committee_match = re.search(r'Name of Committee\s*\n\s*([^\n]+)', text, re.IGNORECASE)
-            if not committee_match:
-                committee_match = re.search(r'FULL NAME OF COMMITTEE\s*\n\s*([^\n]+)', text)
-            if committee_match:
-                metadata['committee_name'] = committee_match.group(1).strip()
-
-            period_match = re.search(r'FROM\s+(\d{1,2}/\d{1,2}/\d{4}).*?THROUGH\s+(\d{1,2}/\d{1,2}/\d{4})', text,
-                                     re.DOTALL)
-            if period_match:
-                metadata['period_start'] = period_match.group(1)
-                metadata['period_end'] = period_match.group(2)
-
-            date_match = re.search(r'Report Date\s*\n\s*(\d{1,2}/\d{1,2}/\d{4})', text, re.IGNORECASE)
-            if not date_match:
-                date_match = re.search(r'DATE OF REPORT.*?(\d{1,2}/\d{1,2}/\d{4})', text, re.DOTALL)
-            if date_match:
-                metadata['date_filed'] = date_match.group(1)
+        st = os.stat(pdf_path)
+        cache_key = (pdf_path, st.st_mtime_ns, st.st_size)
+        if cache_key in _METADATA_CACHE:
+            return _METADATA_CACHE[cache_key]
+        # First-page text comes from PDF_Handler's PDFium-backed,
+        # disk-cached extractor rather than a full pdfplumber open.
+        text = extract_first_page_text(pdf_path)
+        metadata = _parse_metadata_from_text(text, Path(pdf_path).name)
+        _METADATA_CACHE[cache_key] = metadata
+        return metadata
+    except Exception as e:
+        print(f"WARNING: Could not read {Path(pdf_path).name} - {str(e)}")
+        return None
+
+
+def _filed_date_key(date_str: Optional[str]) -> tuple:
+    """Sortable (year, month, day) key for an M/D/YYYY string.
+
+    Integer splitting avoids datetime.strptime's format parsing and
+    still handles non-zero-padded dates; missing/malformed dates sort
+    first.
+    """
+    if date_str:
+        try:
+            month, day, year = date_str.split('/')
+            return int(year), int(month), int(day)
+        except ValueError:
+            pass
+    return 0, 0, 0
+
 
-            return metadata
+def filter_latest_reports(pdf_files: List[Path]) -> List[tuple]:
+    """
+    Filter to keep only the most recent version of each report period.
 
-def filter_latest_reports(pdf_files: List[Path]) -> List[Path]:
-    """Filter to keep only the most recent version of each report period."""
+    Returns (path, metadata) pairs so callers can reuse the metadata
+    already parsed here instead of re-opening the PDFs.
+    """
     reports_by_period = defaultdict(list)
     corrupted_files = []
 
-    for pdf_file in pdf_files:
-        metadata = extract_report_metadata(str(pdf_file))
+    path_strs = [str(p) for p in pdf_files]
 
+    # Metadata extraction opens every PDF, so fan it out across processes;
+    # each file is independent and the parse work is CPU-bound.
+    if len(pdf_files) > 1:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            metadatas = list(executor.map(extract_report_metadata, path_strs, chunksize=4))
+    else:
+        metadatas = [extract_report_metadata(p) for p in path_strs]
+
+    for pdf_file, metadata in zip(pdf_files, metadatas):
         if metadata is None:
             corrupted_files.append(pdf_file.name)
             continue
 
         if metadata['committee_name'] and metadata['period_end']:
             key = (metadata['committee_name'], metadata['period_end'])
-            reports_by_period[key].append((pdf_file, metadata))
+            # Sort key computed once per report; the sort below compares
+            # ready-made int tuples.
+            reports_by_period[key].append((pdf_file, metadata,
+                                           _filed_date_key(metadata['date_filed'])))
 
     if corrupted_files:
         print(f"\nSkipped {len(corrupted_files)} corrupted/invalid PDF(s):")
@@ -75,10 +260,8 @@ def filter_latest_reports(pdf_files: List[Path]) -> List[Path]:
 
     latest_reports = []
     for key, reports in reports_by_period.items():
-        reports.sort(
-            key=lambda x: datetime.strptime(x[1]['date_filed'], '%m/%d/%Y') if x[1]['date_filed'] else datetime.min,
-            reverse=True)
-        latest_reports.append(reports[0][0])
+        reports.sort(key=itemgetter(2), reverse=True)
+        latest_reports.append(reports[0][:2])
 
         if len(reports) > 1:
             print(f"\nFound {len(reports)} versions for {key[0]} ending {key[1]}:")
@@ -90,6 +273,13 @@ def filter_latest_reports(pdf_files: List[Path]) -> List[Path]:
 
 def is_expense_page(text: str) -> tuple:
     """Check if this page contains expense data. Returns (is_expense, page_types_list)."""
+    # Most pages are not expense pages; reject them with cheap raw-text
+    # scans before paying for the full-page .upper() copy below. Every
+    # accepting check requires one of these two words.
+    if ('EXPENDITURES' not in text and 'CONTRIBUTIONS' not in text
+            and 'Expenditures' not in text and 'Contributions' not in text):
+        return (False, [])
+
     text_upper = text.upper()
     page_types = []
 
@@ -125,43 +315,30 @@ def clean_field_text(text: str) -> str:
         return text
 
     # Remove common label prefixes
-    text = re.sub(r'^NAME:\s*', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'^ADDRESS:\s*', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'^CITY\s*/?\s*STATE:\s*', '', text, flags=re.IGNORECASE)
+    text = _NAME_LABEL_RE.sub('', text)
+    text = _ADDRESS_LABEL_RE.sub('', text)
+    text = _CITY_STATE_LABEL_RE.sub('', text)
 
     return text.strip()
 
 
-def is_form_summary_row(text: str) -> bool:
-    """Check if this is a form summary/instruction row."""
+def is_form_summary_row(text: str, text_upper: Optional[str] = None) -> bool:
+    """Check if this is a form summary/instruction row.
+
+    Callers that already hold an uppercase copy of the row can pass it
+    as text_upper to skip the allocation here.
+    """
     if not text:
         return False
 
-    text_upper = text.upper()
-
     # Skip numbered form items
-    if re.match(r'^\d{1,2}\.\s', text):
+    if _NUMBERED_ROW_RE.match(text):
         return True
 
     # Skip common form instruction rows and headers
-    form_phrases = [
-        'AMOUNT OF LINE',
-        'IF COMMITTEE MADE',
-        'FUNDS USED FOR PAYING',
-        'SUBTOTAL',
-        'TOTAL:',
-        'SUM COLUMN',
-        'CARRY TO ITEM',
-        'NAME AND ADDRESS OF RECIPIENT',
-        'C. CONTRIBUTIONS MADE',
-        'CONTRIBUTIONS MADE (REGARDLESS',
-        '20. NAME AND ADDRESS',
-        'ITEMIZED EXPENDITURES',
-        'AND ALL PAYMENTS TO CAMPAIGN',
-        'B. ITEMIZED EXPENDITURES'
-    ]
-
-    return any(phrase in text_upper for phrase in form_phrases)
+    if text_upper is None:
+        text_upper = text.upper()
+    return _FORM_PHRASES_RE.search(text_upper) is not None
 
 
 def extract_amount_from_cell(amount_cell: str) -> Optional[str]:
@@ -169,52 +346,35 @@ def extract_amount_from_cell(amount_cell: str) -> Optional[str]:
     if not amount_cell:
         return None
 
-    # Remove newlines and multiple spaces for easier processing
-    cleaned_cell = ' '.join(amount_cell.split())
-
-    # Strategy 1: Look for amounts with "Paid" or "Incurred" keywords
-    # This handles: "$ 4 Paid 161.80 Incurred" -> extract 161.80
-    paid_amount_match = re.search(r'(?:PAID|Paid)\s+(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)', cleaned_cell, re.IGNORECASE)
-    if paid_amount_match:
-        amount = paid_amount_match.group(1).replace(',', '')
-        try:
-            if float(amount) >= 0.50:
-                return amount
-        except ValueError:
-            pass
+    # Most cells handed here are labels or blanks with no digits at
+    # all; a single \d probe rejects them before the full scan.
+    if not _DIGIT_RE.search(amount_cell):
+        return None
 
-    # Strategy 2: Look for amount immediately after $ with comma formatting
-    # This handles: "$4,990.53" or "$ 4,990.53"
-    comma_amount_match = re.search(r'\$\s*(\d{1,3}(?:,\d{3})+(?:\.\d{2})?)', amount_cell)
-    if comma_amount_match:
-        return comma_amount_match.group(1).replace(',', '')
-
-    # Strategy 3: Look for 3+ digit amount after $
-    # This handles: "$146.00" or "$ 995.00"
-    large_amount_match = re.search(r'\$\s*(\d{3,}(?:\.\d{2})?)', amount_cell)
-    if large_amount_match:
-        return large_amount_match.group(1).replace(',', '')
-
-    # Strategy 4: Look for 2-digit amount with decimal after $
-    # This handles: "$10.75" or "$ 65.07"
-    small_amount_match = re.search(r'\$\s*(\d{1,2}\.\d{2})', amount_cell)
-    if small_amount_match:
-        return small_amount_match.group(1).replace(',', '')
-
-    # Strategy 5: Look for standalone numbers with commas (no $ needed)
-    standalone_comma_match = re.search(r'(?<!\d)(\d{1,3}(?:,\d{3})+(?:\.\d{2})?)(?!\d)', amount_cell)
-    if standalone_comma_match:
-        return standalone_comma_match.group(1).replace(',', '')
-
-    # Strategy 6: Look for 3+ digit standalone numbers
-    standalone_large_match = re.search(r'(?<!\d)(\d{3,}(?:\.\d{2})?)(?!\d)', amount_cell)
-    if standalone_large_match:
-        return standalone_large_match.group(1).replace(',', '')
-
-    # Strategy 7: Look for any decimal numbers (for small amounts like 8.06)
-    decimal_match = re.search(r'(?<!\d)(\d{1,2}\.\d{2})(?!\d)', amount_cell)
-    if decimal_match:
-        return decimal_match.group(1).replace(',', '')
+    # One finditer pass collects the first hit for each strategy group;
+    # the priority order below then decides ties exactly as the old
+    # seven-search ladder did ("Paid 161.80" beats a bare "$ 4", etc.).
+    first_by_group = {}
+    for match in _AMOUNT_RE.finditer(amount_cell):
+        group = match.lastgroup
+        if group not in first_by_group:
+            first_by_group[group] = match.group(group)
+
+    for group in _AMOUNT_GROUP_ORDER:
+        amount = first_by_group.get(group)
+        if amount is None:
+            continue
+        amount = amount.replace(',', '')
+        if group == 'paid':
+            # Paid/Incurred amounts only win when plausible; otherwise
+            # fall through to the weaker strategies.
+            try:
+                if float(amount) >= 0.50:
+                    return amount
+            except ValueError:
+                pass
+            continue
+        return amount
 
     return None
 
@@ -233,7 +393,7 @@ def is_valid_amount(amount_str: str) -> bool:
 
 
 def parse_detailed_expense_table(table: List[List[str]], source_report: str, metadata: Dict, debug: bool = False) -> \
-List[Dict]:
+List[Expense]:
     """Parse detailed expense data with name/address from table."""
     expenses = []
 
@@ -249,12 +409,13 @@ List[Dict]:
     for i, row in enumerate(table[:10]):
         if not row:
             continue
-        row_text = ' '.join([str(cell) or '' for cell in row]).upper()
+        # Upper-case each cell once; the copies serve both the header
+        # test and the column scan, with no joined row string.
+        cells_u = [str(cell or '').upper() for cell in row]
 
-        if 'DATE' in row_text and 'PURPOSE' in row_text:
+        if any('DATE' in cu for cu in cells_u) and any('PURPOSE' in cu for cu in cells_u):
             header_row = i
-            for j, cell in enumerate(row):
-                cell_text = str(cell or '').upper()
+            for j, cell_text in enumerate(cells_u):
                 if 'DATE' in cell_text and 'RECEIVED' not in cell_text:
                     date_col = j
                 if 'PURPOSE' in cell_text:
@@ -284,28 +445,28 @@ List[Dict]:
 
         # Check if this row has expense data
         if first_col and len(first_col) > 3:
-            # Check if amount column has a valid value
-            has_valid_amount = False
+            # Extract the amount once; the validity gate and the entry
+            # parser share the result instead of re-scanning the cell.
+            amount_str = None
             if amount_col is not None and amount_col < len(row):
                 amount_cell = str(row[amount_col] or '').strip()
                 amount_str = extract_amount_from_cell(amount_cell)
-                if amount_str and is_valid_amount(amount_str):
-                    has_valid_amount = True
 
-            if has_valid_amount:
+            if amount_str and is_valid_amount(amount_str):
                 expense = parse_detailed_expense_entry(table, i, date_col, purpose_col, amount_col,
-                                                       source_report, metadata, debug)
+                                                       source_report, metadata, debug,
+                                                       amount_str=amount_str)
                 if expense:
                     expenses.append(expense)
                     if debug:
                         print(
-                            f"    ✓ Row {i}: Found expense - {expense.get('payee_name', 'UNKNOWN')} - ${expense.get('amount', '0')}")
+                            f"    ✓ Row {i}: Found expense - {expense.payee_name} - ${expense.amount}")
 
     return expenses
 
 
-def parse_contributions_table(table: List[List[str]], source_report: str, metadata: Dict, debug: bool = False) -> List[
-    Dict]:
+def parse_contributions_table(table: List[List[str]], source_report: str, metadata: Dict,
+                              debug: bool = False) -> List[Expense]:
     """Parse contributions made to other committees."""
     contributions = []
 
@@ -320,12 +481,13 @@ def parse_contributions_table(table: List[List[str]], source_report: str, metada
     for i, row in enumerate(table[:10]):
         if not row:
             continue
-        row_text = ' '.join([str(cell) or '' for cell in row]).upper()
+        # Same per-cell scan as the detailed parser's header detection.
+        cells_u = [str(cell or '').upper() for cell in row]
 
-        if 'DATE' in row_text and ('AMOUNT' in row_text or 'CANDIDATE OR COMMITTEE' in row_text):
+        if any('DATE' in cu for cu in cells_u) and \
+                any('AMOUNT' in cu or 'CANDIDATE OR COMMITTEE' in cu for cu in cells_u):
             header_row = i
-            for j, cell in enumerate(row):
-                cell_text = str(cell or '').upper()
+            for j, cell_text in enumerate(cells_u):
                 if 'DATE' in cell_text:
                     date_col = j
                 if 'AMOUNT' in cell_text:
@@ -348,44 +510,37 @@ def parse_contributions_table(table: List[List[str]], source_report: str, metada
             continue
 
         if first_col and len(first_col) > 3:
-            # Check if amount column has a value
-            has_valid_amount = False
+            # Same single-extraction pattern as the detailed parser.
+            amount_str = None
             if amount_col is not None and amount_col < len(row):
                 amount_cell = str(row[amount_col] or '').strip()
                 amount_str = extract_amount_from_cell(amount_cell)
-                if amount_str and is_valid_amount(amount_str):
-                    has_valid_amount = True
 
-            if has_valid_amount:
+            if amount_str and is_valid_amount(amount_str):
                 contribution = parse_contribution_entry(table, i, date_col, amount_col,
-                                                        source_report, metadata, debug)
+                                                        source_report, metadata, debug,
+                                                        amount_str=amount_str)
                 if contribution:
                     contributions.append(contribution)
                     if debug:
                         print(
-                            f"    Row {i}: Found contribution - {contribution.get('payee_name', 'UNKNOWN')} - ${contribution.get('amount', '0')}")
+                            f"    Row {i}: Found contribution - {contribution.payee_name} - ${contribution.amount}")
 
     return contributions
 
 
 def parse_contribution_entry(table: List[List[str]], start_row: int, date_col: Optional[int],
                              amount_col: Optional[int], source_report: str, metadata: Dict,
-                             debug: bool = False) -> Optional[Dict]:
+                             debug: bool = False, amount_str: Optional[str] = None) -> Optional[Expense]:
     """Parse a single contribution entry."""
 
-    contribution = {
-        'source_report': source_report,
-        'committee_name': metadata.get('committee_name', ''),
-        'report_period': f"{metadata.get('period_start', '')} to {metadata.get('period_end', '')}",
-        'payee_name': None,
-        'payee_address': None,
-        'payee_city_state': None,
-        'date': None,
-        'purpose': 'Contribution to Committee',
-        'amount': None,
-        'payment_status': None,
-        'expense_type': 'Contribution'
-    }
+    contribution = Expense(
+        source_report=source_report,
+        committee_name=metadata.get('committee_name', ''),
+        report_period=f"{metadata.get('period_start', '')} to {metadata.get('period_end', '')}",
+        purpose='Contribution to Committee',
+        expense_type='Contribution',
+    )
 
     if start_row >= len(table):
         return None
@@ -404,34 +559,35 @@ def parse_contribution_entry(table: List[List[str]], start_row: int, date_col: O
 
         # First line is typically the committee name
         if lines:
-            contribution['payee_name'] = lines[0]
+            contribution.payee_name = lines[0]
 
         # Second line is typically the address
         if len(lines) > 1:
-            contribution['payee_address'] = lines[1]
+            contribution.payee_address = lines[1]
 
         # Third line is typically city/state/zip
         if len(lines) > 2:
-            contribution['payee_city_state'] = lines[2]
+            contribution.payee_city_state = lines[2]
     else:
-        contribution['payee_name'] = clean_field_text(first_col)
+        contribution.payee_name = clean_field_text(first_col)
 
     # Extract date
     if date_col is not None and date_col < len(row):
         date_cell = str(row[date_col] or '').strip()
         if date_cell:
-            date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', date_cell)
+            date_match = _MDY_RE.search(date_cell)
             if date_match:
-                contribution['date'] = date_match.group(1)
+                contribution.date = date_match.group(1)
 
-    # Extract amount
+    # Extract amount (reusing the caller's scan when provided)
     if amount_col is not None and amount_col < len(row):
-        amount_cell = str(row[amount_col] or '').strip()
-        amount_str = extract_amount_from_cell(amount_cell)
+        if amount_str is None:
+            amount_cell = str(row[amount_col] or '').strip()
+            amount_str = extract_amount_from_cell(amount_cell)
         if amount_str and is_valid_amount(amount_str):
-            contribution['amount'] = amount_str
+            contribution.amount = amount_str
 
-    if not contribution['payee_name'] or not contribution['amount']:
+    if not contribution.payee_name or not contribution.amount:
         return None
 
     return contribution
@@ -439,22 +595,15 @@ def parse_contribution_entry(table: List[List[str]], start_row: int, date_col: O
 
 def parse_detailed_expense_entry(table: List[List[str]], start_row: int, date_col: Optional[int],
                                  purpose_col: Optional[int], amount_col: Optional[int],
-                                 source_report: str, metadata: Dict, debug: bool = False) -> Optional[Dict]:
+                                 source_report: str, metadata: Dict, debug: bool = False,
+                                 amount_str: Optional[str] = None) -> Optional[Expense]:
     """Parse a single detailed expense entry."""
 
-    expense = {
-        'source_report': source_report,
-        'committee_name': metadata.get('committee_name', ''),
-        'report_period': f"{metadata.get('period_start', '')} to {metadata.get('period_end', '')}",
-        'payee_name': None,
-        'payee_address': None,
-        'payee_city_state': None,
-        'date': None,
-        'purpose': None,
-        'amount': None,
-        'payment_status': None,
-        'expense_type': 'Expense'
-    }
+    expense = Expense(
+        source_report=source_report,
+        committee_name=metadata.get('committee_name', ''),
+        report_period=f"{metadata.get('period_start', '')} to {metadata.get('period_end', '')}",
+    )
 
     if start_row >= len(table):
         return None
@@ -473,57 +622,59 @@ def parse_detailed_expense_entry(table: List[List[str]], start_row: int, date_co
 
         # First line is typically the payee name
         if lines:
-            expense['payee_name'] = lines[0]
+            expense.payee_name = lines[0]
 
         # Second line is typically the address
         if len(lines) > 1:
-            expense['payee_address'] = lines[1]
+            expense.payee_address = lines[1]
 
         # Third line is typically city/state/zip
         if len(lines) > 2:
-            expense['payee_city_state'] = lines[2]
+            expense.payee_city_state = lines[2]
     else:
-        expense['payee_name'] = clean_field_text(first_col)
+        expense.payee_name = clean_field_text(first_col)
 
     # Extract date
     if date_col is not None and date_col < len(row):
         date_cell = str(row[date_col] or '').strip()
         if date_cell:
-            date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', date_cell)
+            date_match = _MDY_RE.search(date_cell)
             if date_match:
-                expense['date'] = date_match.group(1)
+                expense.date = date_match.group(1)
 
     # Extract purpose
     if purpose_col is not None and purpose_col < len(row):
         purpose_cell = str(row[purpose_col] or '').strip()
 
         # Check if purpose cell contains a date (swapped columns)
-        date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', purpose_cell)
-        if date_match and not expense['date']:
+        date_match = _MDY_RE.search(purpose_cell)
+        if date_match and not expense.date:
             # Columns are swapped - this is the date
-            expense['date'] = date_match.group(1)
+            expense.date = date_match.group(1)
         else:
             # Normal purpose field
-            purpose_cell = re.sub(r'\$\s*$', '', purpose_cell)
+            purpose_cell = _TRAILING_DOLLAR_RE.sub('', purpose_cell)
             if purpose_cell:
-                expense['purpose'] = purpose_cell
+                expense.purpose = purpose_cell
 
     # Extract amount and payment status
     if amount_col is not None and amount_col < len(row):
         amount_cell = str(row[amount_col] or '').strip()
+        amount_cell_upper = amount_cell.upper()
 
         # Check for Paid/Incurred status
-        if '✔' in amount_cell or '✓' in amount_cell or 'PAID' in amount_cell.upper():
-            expense['payment_status'] = 'Paid'
-        elif 'INCURRED' in amount_cell.upper():
-            expense['payment_status'] = 'Incurred'
-
-        # Extract amount using improved method
-        amount_str = extract_amount_from_cell(amount_cell)
+        if '✔' in amount_cell or '✓' in amount_cell or 'PAID' in amount_cell_upper:
+            expense.payment_status = 'Paid'
+        elif 'INCURRED' in amount_cell_upper:
+            expense.payment_status = 'Incurred'
+
+        # Extract amount (reusing the caller's scan when provided)
+        if amount_str is None:
+            amount_str = extract_amount_from_cell(amount_cell)
         if amount_str and is_valid_amount(amount_str):
-            expense['amount'] = amount_str
+            expense.amount = amount_str
 
-    if not expense['payee_name'] or not expense['amount']:
+    if not expense.payee_name or not expense.amount:
         return None
 
     return expense
@@ -534,42 +685,25 @@ def is_valid_category_name(category: str) -> bool:
     if not category or len(category) < 2:
         return False
 
-    category_upper = category.upper()
-
-    # Skip form instructions/headers
-    invalid_patterns = [
-        'NAME:',
-        'ADDRESS:',
-        'CITY',
-        'STATE:',
-        'SUBTOTAL',
-        'TOTAL',
-        'SUM COLUMN',
-        'CARRY TO',
-        'AMOUNT OF LINE',
-        'EXPENDITURES AND CONTRIBUTIONS',
-        'CATEGORY OF EXPENDITURE',
-        'FUNDS USED FOR PAYING',
-    ]
-
     # Allow numbered items that are NOT form instructions (16., 17., etc are usually form fields)
     # But "2nd batch business cards" should be allowed
-    if re.match(r'^\d{1,2}\.\s', category) and not any(
+    if _NUMBERED_ROW_RE.match(category) and not any(
             word in category.lower() for word in ['batch', 'card', 'fee', 'service']):
         return False
 
-    if any(pattern in category_upper for pattern in invalid_patterns):
+    # Skip form instructions/headers
+    if _INVALID_CATEGORY_RE.search(category.upper()):
         return False
 
     # Must contain at least one letter
-    if not re.search(r'[a-zA-Z]', category):
+    if not _HAS_LETTER_RE.search(category):
         return False
 
     return True
 
 
 def parse_category_expense_table(table: List[List[str]], source_report: str, metadata: Dict, debug: bool = False) -> \
-List[Dict]:
+List[Expense]:
     """Parse category expenses (aggregated expenses $100 or less)."""
     expenses = []
 
@@ -584,8 +718,7 @@ List[Dict]:
     for i, row in enumerate(table):
         if not row:
             continue
-        row_text = ' '.join([str(cell) or '' for cell in row]).upper()
-        if 'CATEGORY OF EXPENDITURE' in row_text:
+        if any('CATEGORY OF EXPENDITURE' in str(cell or '').upper() for cell in row):
             start_row = i + 1
             if debug:
                 print(f"    Category header found at row {i}, starting data at row {start_row}")
@@ -626,20 +759,15 @@ List[Dict]:
                 print(f"      Rejected: no amount or $0.00")
             continue
 
-        expense = {
-            'source_report': source_report,
-            'committee_name': metadata.get('committee_name', ''),
-            'report_period': f"{metadata.get('period_start', '')} to {metadata.get('period_end', '')}",
-            'payee_name': None,
-            'payee_address': None,
-            'payee_city_state': None,
-            'date': metadata.get('date_filed'),  # Use filing date for categories
-            'purpose': category,
-            'amount': amount,
-            'payment_status': 'Category',
-            'expense_type': 'Expense'
-        }
-        expenses.append(expense)
+        expenses.append(Expense(
+            source_report=source_report,
+            committee_name=metadata.get('committee_name', ''),
+            report_period=f"{metadata.get('period_start', '')} to {metadata.get('period_end', '')}",
+            date=metadata.get('date_filed'),  # Use filing date for categories
+            purpose=category,
+            amount=amount,
+            payment_status='Category',
+        ))
 
         if debug:
             print(f"    ✓ Found category expense: {category} - ${amount}")
@@ -647,41 +775,65 @@ List[Dict]:
     return expenses
 
 
-def deduplicate_expenses(expenses: List[Dict]) -> List[Dict]:
+# Dedup keys; category expenses have no payee, so they key on purpose.
+_DETAIL_KEY = attrgetter('payee_name', 'amount', 'date', 'expense_type')
+_CATEGORY_KEY = attrgetter('purpose', 'amount', 'date')
+
+
+def deduplicate_expenses(expenses: List[Expense]) -> List[Expense]:
     """Remove duplicate expenses based on payee, amount, and date."""
     seen = set()
+    seen_add = seen.add
     deduplicated = []
 
     for expense in expenses:
-        # Create a unique key for this expense
-        # For category expenses (no payee), use purpose + amount + date
-        if expense.get('payment_status') == 'Category':
-            key = (
-                expense.get('purpose', ''),
-                expense.get('amount', ''),
-                expense.get('date', ''),
-                'Category'
-            )
+        if expense.payment_status == 'Category':
+            key = _CATEGORY_KEY(expense) + ('Category',)
         else:
-            # For itemized expenses, use payee + amount + date
-            key = (
-                expense.get('payee_name', ''),
-                expense.get('amount', ''),
-                expense.get('date', ''),
-                expense.get('expense_type', '')
-            )
+            key = _DETAIL_KEY(expense)
 
         if key not in seen:
-            seen.add(key)
+            seen_add(key)
             deduplicated.append(expense)
 
     return deduplicated
 
 
-def extract_expenses_from_pdf(pdf_path: str, debug: bool = False) -> List[Dict]:
-    """Extract all expense information from a PDF report."""
+def _table_page_type(table: List[List[str]], page_types: List[str]) -> Optional[str]:
+    """Pick the single page type a table belongs to by probing its first
+    rows for each type's header marker. Returns None when no marker is
+    found; the caller then falls back to trying every detected type."""
+    for row in table[:10]:
+        if not row:
+            continue
+        for cell in row:
+            cell_upper = str(cell or '').upper()
+            if 'contributions' in page_types and 'CANDIDATE OR COMMITTEE' in cell_upper:
+                return 'contributions'
+            if 'category' in page_types and 'CATEGORY OF EXPENDITURE' in cell_upper:
+                return 'category'
+            if 'detailed' in page_types and 'PURPOSE' in cell_upper:
+                return 'detailed'
+    return None
+
+
+def extract_expenses_from_pdf(pdf_path: str, metadata: Optional[Dict] = None, debug: bool = False) -> List[Expense]:
+    """Extract all expense information from a PDF report.
+
+    Callers that already hold the report metadata (filter_latest_reports
+    returns it) can pass it in to skip re-reading the first page.
+    """
+    # Debug runs bypass the result cache so their per-page output
+    # always appears.
+    cache_file = None if debug else _expense_cache_file(pdf_path)
+    if cache_file is not None:
+        cached = _load_cached_expenses(cache_file)
+        if cached is not None:
+            return cached
+
     expenses = []
-    metadata = extract_report_metadata(pdf_path)
+    if metadata is None:
+        metadata = extract_report_metadata(pdf_path)
 
     if metadata is None:
         return expenses
@@ -703,22 +855,20 @@ def extract_expenses_from_pdf(pdf_path: str, debug: bool = False) -> List[Dict]:
                 is_expense, page_types = is_expense_page(text)
 
                 if not is_expense:
+                    page.flush_cache()
                     continue
 
                 if debug:
                     print(f"\n--- Page {page_num}: {', '.join(page_types)} page detected ---")
 
-                table_settings = {
-                    "vertical_strategy": "lines",
-                    "horizontal_strategy": "lines",
-                    "intersection_tolerance": 15,
-                }
-
-                tables = page.extract_tables(table_settings)
+                tables = page.extract_tables(_LINE_TABLE_SETTINGS)
 
-                # Process each page type found on this page
-                for page_type in page_types:
-                    for table_num, table in enumerate(tables):
+                # Dispatch each table to one parser when its header
+                # marker identifies it; unmarked tables fall back to
+                # being tried under every type found on the page.
+                for table_num, table in enumerate(tables):
+                    table_type = _table_page_type(table, page_types) if len(page_types) > 1 else None
+                    for page_type in ([table_type] if table_type else page_types):
                         if debug:
                             print(f"\nTable {table_num + 1} on page {page_num} (parsing as {page_type}):")
                             print(f"  Rows: {len(table)}")
@@ -737,15 +887,34 @@ def extract_expenses_from_pdf(pdf_path: str, debug: bool = False) -> List[Dict]:
                         if debug:
                             print(f"  Extracted {len(page_expenses)} items from this table")
 
+                # Chars/edges for this page are no longer needed; drop
+                # them so multi-hundred-page PDFs stay flat on memory.
+                page.flush_cache()
+
     except Exception as e:
         print(f"Error processing {source_report}: {str(e)}")
 
     # Deduplicate before returning
     expenses = deduplicate_expenses(expenses)
 
+    if cache_file is not None:
+        _store_cached_expenses(cache_file, expenses)
+
     return expenses
 
 
+def _extract_expenses_worker(job: tuple) -> tuple:
+    """Run one PDF in a pool worker. Returns (name, expenses, error)
+    instead of raising. Module-level so it pickles cleanly to
+    ProcessPoolExecutor workers."""
+    pdf_path, metadata = job
+    name = Path(pdf_path).name
+    try:
+        return name, extract_expenses_from_pdf(pdf_path, metadata), None
+    except Exception as e:
+        return name, [], str(e)
+
+
 def process_all_expenses(mecid: str = None, debug: bool = False) -> None:
     """
     Main function to process all PDFs and extract expense data.
@@ -791,13 +960,27 @@ def process_all_expenses(mecid: str = None, debug: bool = False) -> None:
 
     all_expenses = []
 
-    for pdf_file in latest_reports:
-        try:
-            expenses = extract_expenses_from_pdf(str(pdf_file), debug=debug)
-            all_expenses.extend(expenses)
-            print(f"[OK] {pdf_file.name}: Found {len(expenses)} item(s)")
-        except Exception as e:
-            print(f"[ERROR] {pdf_file.name}: {str(e)}")
+    # Each PDF is independent and pdfplumber's layout work is CPU-bound,
+    # so fan the files out across processes. Debug runs stay serial to
+    # keep their output readable.
+    if debug or len(latest_reports) == 1:
+        for pdf_file, metadata in latest_reports:
+            try:
+                expenses = extract_expenses_from_pdf(str(pdf_file), metadata, debug=debug)
+                all_expenses.extend(expenses)
+                print(f"[OK] {pdf_file.name}: Found {len(expenses)} item(s)")
+            except Exception as e:
+                print(f"[ERROR] {pdf_file.name}: {str(e)}")
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for name, expenses, error in executor.map(
+                    _extract_expenses_worker,
+                    [(str(p), m) for p, m in latest_reports], chunksize=1):
+                if error is not None:
+                    print(f"[ERROR] {name}: {error}")
+                    continue
+                all_expenses.extend(expenses)
+                print(f"[OK] {name}: Found {len(expenses)} item(s)")
 
     if all_expenses:
         write_expenses_to_csv(all_expenses, str(output_csv))
@@ -809,26 +992,15 @@ def process_all_expenses(mecid: str = None, debug: bool = False) -> None:
         print("\nNo expense data extracted")
 
 
-def write_expenses_to_csv(expenses: List[Dict], output_file: str) -> None:
+def write_expenses_to_csv(expenses: List[Expense], output_file: str) -> None:
     """Write expense data to CSV file."""
-    fieldnames = [
-        'source_report',
-        'committee_name',
-        'report_period',
-        'expense_type',
-        'payee_name',
-        'payee_address',
-        'payee_city_state',
-        'date',
-        'purpose',
-        'amount',
-        'payment_status'
-    ]
-
-    with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(expenses)
+    # Expense declares its fields in CSV column order, so astuple rows
+    # line up with the fields() header; the 1 MiB buffer batches the
+    # flushes.
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow([f.name for f in fields(Expense)])
+        writer.writerows(astuple(e) for e in expenses)
 
 
 if __name__ == "__main__":
